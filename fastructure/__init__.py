@@ -1,5 +1,13 @@
-from . import exceptions
+from . import exceptions, instrumentation
 from .converters import Converter
-from .decorator import structured
+from .decorator import structured, warmup
+from .instrumentation import stats
 
-__all__ = ["structured", "exceptions", "Converter"]
+__all__ = [
+    "structured",
+    "warmup",
+    "exceptions",
+    "instrumentation",
+    "stats",
+    "Converter",
+]
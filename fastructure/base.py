@@ -1,12 +1,25 @@
-import inspect
-from typing import ClassVar, Type, Unpack, dataclass_transform
+import dataclasses
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, ClassVar, Self, Type, Unpack, dataclass_transform
 
+from fastructure import instrumentation
 from fastructure.config import Config, ConfigType, MapType
 from fastructure.converters import Converter
+from fastructure.exceptions import RowError
 from fastructure.exceptions import ValidationError as BaseValidationError
-from fastructure.parameter_parser import ParameterParser
+from fastructure.index import MapIndex
 from fastructure.reference import Reference
 
+# loaders, parallel and dumper are imported on first use,
+# with json, csv, mmap, struct and pickle.
+if TYPE_CHECKING:
+    from fastructure import loaders, parallel
+    from fastructure.collection import ModelArray
+    from fastructure.dumper import Dumper
+    from fastructure.plan import ConstructionPlan
+
 
 @dataclass_transform()
 class BaseModelMeta(type):
@@ -14,8 +27,15 @@ class BaseModelMeta(type):
 
 
 class BaseModel[InstanceType](metaclass=BaseModelMeta):
+    # models of slotted dataclasses have no instance __dict__ either.
+    __slots__ = ()
+
     _config: ClassVar[Config]
     _references: ClassVar[tuple[Reference, ...]]
+    _plan: ClassVar["ConstructionPlan"]
+    _dumper: ClassVar["Dumper"]
+    _dict_map_index: ClassVar[MapIndex[str]]
+    _list_map_index: ClassVar[MapIndex[int]]
 
     def __init_subclass__(
         cls, *, converter: Type[Converter] = Converter, **kwargs: Unpack[ConfigType]
@@ -32,53 +52,33 @@ class BaseModel[InstanceType](metaclass=BaseModelMeta):
         return kwargs
 
     @classmethod
-    def _construct(cls: Type[InstanceType], **kwargs) -> InstanceType:
-        original_values = cls._add_keys(kwargs.copy())
-        for field_name, original_val in original_values.items():
-            try:
-                clean_method = cls._config.get_clean_method(field_name, cls)
-            except AttributeError:
-                try:
-                    ref = [
-                        ref for ref in cls._references if ref.cls_var_name == field_name
-                    ][0]
-                except IndexError:
-                    continue
-
-                kwargs[ref.cls_var_name] = cls._config.parse(
-                    value=original_val, annotation=ref
-                )
-                continue
-
-            if not callable(clean_method):
-                continue
-
-            parser = ParameterParser(clean_method, cls._config, original_values.copy())
-            kwargs[field_name] = clean_method(*parser.list_params, **parser.dict_params)
-
-        parser_for_clean = ParameterParser(cls.clean, cls._config, kwargs.copy())
-        cleaned = kwargs | cls.clean(
-            *parser_for_clean.list_params, **parser_for_clean.dict_params
-        )
-        init_parser = ParameterParser(cls, cls._config, cleaned)
-        return cls(*init_parser.list_params, **init_parser.dict_params)
+    def _has_default_clean(cls) -> bool:
+        # `clean` may also be overridden by a staticmethod or a plain function.
+        clean = cls.clean
+        return getattr(clean, "__func__", clean) is BaseModel.clean.__func__
 
     @classmethod
-    def _add_keys(cls, data: dict) -> dict:
-        """
-        insert clean method keys to data.
-        """
-        for method_name, _ in inspect.getmembers(cls, predicate=inspect.ismethod):
-            # set clean method to None if it's not in kwargs
-            try:
-                field_name = cls._config.substring_field_name(method_name)
-            except ValueError:
-                continue
+    def _get_plan(cls) -> "ConstructionPlan":
+        # inherited plans build the parent, a subclass which is not decorated
+        # itself gets a plan of its own.
+        plan = cls._plan
+        if plan.model is not cls:
+            from fastructure.decorator import prepare
+
+            plan = prepare(cls)
+        return plan
 
-            if field_name not in data:
-                data[field_name] = None
+    @classmethod
+    def _construct(cls: Type[InstanceType], **kwargs) -> InstanceType:
+        return cls._get_plan().execute(**kwargs)
 
-        return data
+    @classmethod
+    async def _aconstruct(cls: Type[InstanceType], **kwargs) -> InstanceType:
+        plan = cls._get_plan()
+        if not plan.is_async:
+            # `_construct` is replaced in collect_errors mode.
+            return cls._construct(**kwargs)
+        return await plan.execute_async(**kwargs)
 
     @classmethod
     def dict_map(cls) -> dict[str, MapType]:
@@ -89,40 +89,315 @@ class BaseModel[InstanceType](metaclass=BaseModelMeta):
         return {i: ref for i, ref in enumerate(cls._references)}
 
     @classmethod
-    def from_dict(cls: Type[InstanceType], data: dict) -> InstanceType:
-        dict_map = cls._config.get_dict_map(cls)
-        kwargs = {}
-        for expected_key, ref in dict_map.items():
-            if expected_key not in data:
-                raise cls.ValidationError(
-                    f"{expected_key} is required to make a instance of '{cls.__name__}'"
-                )
+    def _dict_index(cls) -> MapIndex[str]:
+        """
+        dict_map resolved into (expected key, var name) pairs, once per class.
+        """
+        try:
+            return cls.__dict__["_dict_map_index"]
+        except KeyError:
+            index = MapIndex.of_dict_map(cls._config.get_dict_map(cls))
+            cls._dict_map_index = index
+            return index
 
-            var_name = ref.cls_var_name if isinstance(ref, Reference) else ref
-            kwargs[var_name] = data[expected_key]
+    @classmethod
+    def _list_index(cls) -> MapIndex[int]:
+        """
+        list_map resolved into (position, var name) pairs, once per class.
+        """
+        try:
+            return cls.__dict__["_list_map_index"]
+        except KeyError:
+            index = MapIndex.of_list_map(cls._config.get_list_map(cls))
+            cls._list_map_index = index
+            return index
 
+    @classmethod
+    def invalidate_maps(cls) -> None:
+        """
+        forget the resolved dict_map / list_map, for maps that change at runtime.
+        they are resolved again on the next call.
+        """
+        for name in ("_dict_map_index", "_list_map_index", "_dumper"):
+            if name in cls.__dict__:
+                delattr(cls, name)
+        if cls._config.compile and not cls._config.collect_errors:
+            from fastructure import codegen
+
+            codegen.install(cls)
+
+    @classmethod
+    def _from_dict_index(
+        cls: Type[InstanceType], index: MapIndex[str], data: dict
+    ) -> InstanceType:
+        if (recorder := instrumentation.recorder) is None:
+            return cls._construct(**cls._dict_kwargs(index, data))
+
+        start = perf_counter_ns()
+        kwargs = cls._dict_kwargs(index, data)
+        recorder.record(cls, "map", None, perf_counter_ns() - start)
         return cls._construct(**kwargs)
 
+    @classmethod
+    def _dict_kwargs(cls, index: MapIndex[str], data: dict) -> dict:
+        try:
+            return {var_name: data[key] for key, var_name in index.pairs}
+        except KeyError:
+            for expected_key, _ in index.pairs:
+                if expected_key not in data:
+                    raise cls.ValidationError(
+                        f"{expected_key} is required to make a instance of "
+                        f"'{cls.__name__}'"
+                    )
+            raise
+
+    @classmethod
+    def _from_list_index(
+        cls: Type[InstanceType], index: MapIndex[int], data: list
+    ) -> InstanceType:
+        if (recorder := instrumentation.recorder) is None:
+            return cls._construct(**cls._list_kwargs(index, data))
+
+        start = perf_counter_ns()
+        kwargs = cls._list_kwargs(index, data)
+        recorder.record(cls, "map", None, perf_counter_ns() - start)
+        return cls._construct(**kwargs)
+
+    @classmethod
+    def _list_kwargs(cls, index: MapIndex[int], data: list) -> dict:
+        if len(data) < index.length:
+            raise cls.ValidationError(
+                f"class '{cls.__name__}' must have a list map with length {len(data)}"
+            )
+        return {var_name: data[i] for i, var_name in index.pairs}
+
+    @classmethod
+    def _iter_rows[Row, Index](
+        cls: Type[InstanceType],
+        build: Callable[[Index, Row], InstanceType],
+        index: Index,
+        rows: Iterable[Row],
+        errors: list[RowError] | None,
+    ) -> Iterator[InstanceType]:
+        if errors is None:
+            for row in rows:
+                yield build(index, row)
+            return
+
+        for i, row in enumerate(rows):
+            try:
+                yield build(index, row)
+            except Exception as e:
+                errors.append(RowError(index=i, error=e))
+
+    @classmethod
+    def from_dict(cls: Type[InstanceType], data: dict) -> InstanceType:
+        return cls._from_dict_index(cls._dict_index(), data)
+
     @classmethod
     def from_list(cls: Type[InstanceType], data: list) -> InstanceType:
-        list_map = cls._config.get_list_map(cls)
-        list_result = (
-            list_map
-            if isinstance(list_map, dict)
-            else {i: value for i, value in enumerate(list_map)}
+        return cls._from_list_index(cls._list_index(), data)
+
+    @classmethod
+    def from_dicts(
+        cls: Type[InstanceType],
+        rows: Iterable[dict],
+        *,
+        errors: list[RowError] | None = None,
+        workers: int | None = None,
+        chunksize: int = 1000,
+    ) -> list[InstanceType]:
+        """
+        build an instance per dict, resolving dict_map only once.
+        if `errors` is given, failed rows are appended to it and skipped.
+        with `workers`, rows are built in a process pool `chunksize` rows at a time.
+        """
+        if workers is not None:
+            from fastructure import parallel
+
+            return parallel.build_in_workers(
+                cls, "dict", rows, workers=workers, chunksize=chunksize, errors=errors
+            )
+        return list(
+            cls._iter_rows(cls._from_dict_index, cls._dict_index(), rows, errors)
         )
-        kwargs = {}
-        for i, ref in list_result.items():
-            if i >= len(data):
-                raise cls.ValidationError(
-                    f"class '{cls.__name__}' must have "
-                    f"a list map with length {len(data)}"
-                )
-
-            var_name = ref.cls_var_name if isinstance(ref, Reference) else ref
-            kwargs[var_name] = data[i]
-        return cls._construct(**kwargs)
+
+    @classmethod
+    def from_lists(
+        cls: Type[InstanceType],
+        rows: Iterable[list],
+        *,
+        errors: list[RowError] | None = None,
+        workers: int | None = None,
+        chunksize: int = 1000,
+    ) -> list[InstanceType]:
+        """
+        build an instance per list, resolving list_map only once.
+        if `errors` is given, failed rows are appended to it and skipped.
+        with `workers`, rows are built in a process pool `chunksize` rows at a time.
+        """
+        if workers is not None:
+            from fastructure import parallel
+
+            return parallel.build_in_workers(
+                cls, "list", rows, workers=workers, chunksize=chunksize, errors=errors
+            )
+        return list(
+            cls._iter_rows(cls._from_list_index, cls._list_index(), rows, errors)
+        )
+
+    @classmethod
+    async def afrom_dict(cls: Type[InstanceType], data: dict) -> InstanceType:
+        if not cls._get_plan().is_async:
+            return cls.from_dict(data)
+        return await cls._aconstruct(**cls._dict_kwargs(cls._dict_index(), data))
+
+    @classmethod
+    async def afrom_dicts(
+        cls: Type[InstanceType],
+        rows: Iterable[dict],
+        *,
+        errors: list[RowError] | None = None,
+        concurrency: int = 100,
+    ) -> list[InstanceType]:
+        """
+        async version of from_dicts. up to `concurrency` rows are built at a time.
+        models without async clean methods are built synchronously.
+        """
+        if not cls._get_plan().is_async:
+            return cls.from_dicts(rows, errors=errors)
+
+        import asyncio
+
+        index = cls._dict_index()
+
+        async def build(row: dict) -> InstanceType:
+            return await cls._aconstruct(**cls._dict_kwargs(index, row))
+
+        instances = []
+        rows = enumerate(rows)
+        for batch in itertools.batched(rows, concurrency):
+            results = await asyncio.gather(
+                *(build(row) for _, row in batch),
+                return_exceptions=errors is not None,
+            )
+            for (i, _), result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    errors.append(RowError(index=i, error=result))
+                else:
+                    instances.append(result)
+        return instances
+
+    @classmethod
+    def iter_jsonl(
+        cls: Type[InstanceType],
+        source: "loaders.Source",
+        *,
+        errors: list[RowError] | None = None,
+    ) -> Iterator[InstanceType]:
+        from fastructure import loaders
+
+        return loaders.iter_jsonl(cls, source, errors=errors)
+
+    @classmethod
+    def iter_csv(
+        cls: Type[InstanceType],
+        source: "loaders.Source",
+        *,
+        header: bool = True,
+        errors: list[RowError] | None = None,
+        **fmtparams,
+    ) -> Iterator[InstanceType]:
+        from fastructure import loaders
+
+        return loaders.iter_csv(cls, source, header=header, errors=errors, **fmtparams)
+
+    @classmethod
+    def buffer_map(cls) -> dict[int, str] | list[str]:
+        """
+        struct format of each list_map position, for `iter_buffer`.
+        derived from int, float, bool and datetime (epoch seconds) annotations.
+        """
+        from fastructure import loaders
+
+        return loaders.struct_formats(cls)
+
+    @classmethod
+    def iter_buffer(
+        cls: Type[InstanceType],
+        source: "loaders.BinarySource",
+        *,
+        byte_order: str = "<",
+        errors: list[RowError] | None = None,
+    ) -> Iterator[InstanceType]:
+        from fastructure import loaders
+
+        return loaders.iter_buffer(cls, source, byte_order=byte_order, errors=errors)
+
+    def validate(self) -> Self:
+        """
+        build every lazy field now, including those of nested models,
+        so that invalid nested data raises here rather than on first access.
+        """
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+            values = value if isinstance(value, (list, tuple)) else (value,)
+            for val in values:
+                if isinstance(val, BaseModel):
+                    val.validate()
+        return self
+
+    @classmethod
+    def collection(
+        cls: Type[InstanceType], rows: Iterable, *, kind: "parallel.Kind" = "dict"
+    ) -> "ModelArray[InstanceType]":
+        """
+        load rows into columns instead of instances. requires numpy.
+        """
+        from fastructure.collection import ModelArray
+
+        return ModelArray.from_rows(cls, rows, kind)
+
+    @classmethod
+    def conversion_cache_info(cls) -> dict[type, tuple[int, int, int, int]]:
+        """
+        hits and misses of the `conversion_cache` of this model, per target type.
+        """
+        return cls._config.conversion_cache_info()
+
+    @classmethod
+    def _get_dumper(cls) -> "Dumper":
+        # compiled on first use, maps may refer to models defined later.
+        try:
+            return cls.__dict__["_dumper"]
+        except KeyError:
+            from fastructure.dumper import Dumper
+
+            cls._dumper = Dumper.compile(cls)
+            return cls._dumper
+
+    def to_dict(self) -> dict:
+        """
+        inverse of from_dict. nested models are dumped with their own dict_map.
+        """
+        return self._get_dumper().to_dict(self)
+
+    def to_list(self) -> list:
+        """
+        inverse of from_list. nested models are dumped with their own list_map.
+        """
+        return self._get_dumper().to_list(self)
 
     @classmethod
     def construct(cls: Type[InstanceType], **kwargs) -> InstanceType:
         return cls._construct(**kwargs)
+
+    @classmethod
+    async def aconstruct(cls: Type[InstanceType], **kwargs) -> InstanceType:
+        """
+        construct, awaiting async clean_* / clean methods.
+        nested models are still built synchronously.
+        """
+        return await cls._aconstruct(**kwargs)
@@ -0,0 +1,97 @@
+"""
+Micro benchmarks for the construction hot paths.
+
+Run every scenario and print the results as JSON:
+    python -m fastructure.bench
+"""
+
+import dataclasses
+import gc
+import platform
+import time
+import tracemalloc
+from typing import Any, Callable
+
+type Operation = Callable[[], Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class Scenario:
+    name: str
+    setup: Callable[[], Operation]
+    # instances built by a single call of the operation
+    ops_per_call: int = 1
+    # caps the calls per repeat of slow scenarios, such as a new interpreter
+    max_number: int | None = None
+
+
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def scenario(name: str, *, ops_per_call: int = 1, max_number: int | None = None):
+    """
+    register a function returning the operation to measure.
+    """
+
+    def decorator(setup: Callable[[], Operation]) -> Callable[[], Operation]:
+        SCENARIOS[name] = Scenario(
+            name=name, setup=setup, ops_per_call=ops_per_call, max_number=max_number
+        )
+        return setup
+
+    return decorator
+
+
+def _measure_allocations(operation: Operation) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = operation()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak - before, after - before
+
+
+def run(scenario: Scenario, *, number: int, repeat: int) -> dict:
+    if scenario.max_number is not None:
+        number = min(number, scenario.max_number)
+    operation = scenario.setup()
+    operation()  # warm up lazily built caches
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        best = min(best, time.perf_counter() - start)
+
+    peak, retained = _measure_allocations(operation)
+    return {
+        "name": scenario.name,
+        "ops_per_sec": number * scenario.ops_per_call / best,
+        "seconds_per_call": best / number,
+        "peak_bytes_per_call": peak,
+        "retained_bytes_per_call": retained,
+        "ops_per_call": scenario.ops_per_call,
+    }
+
+
+def run_all(
+    names: list[str] | None = None, *, number: int = 1000, repeat: int = 5
+) -> dict:
+    from fastructure.bench import scenarios  # noqa: F401 registers the scenarios
+
+    selected = [SCENARIOS[name] for name in names or SCENARIOS]
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "number": number,
+        "repeat": repeat,
+        "results": [
+            run(scenario, number=number, repeat=repeat) for scenario in selected
+        ],
+    }
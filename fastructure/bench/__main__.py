@@ -0,0 +1,33 @@
+import argparse
+import json
+import sys
+
+from fastructure.bench import scenarios  # noqa: F401 registers the scenarios
+from fastructure.bench import SCENARIOS, run_all
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m fastructure.bench",
+        description="Measure fastructure hot paths and print the results as JSON.",
+    )
+    parser.add_argument("names", nargs="*", help="scenarios to run (default: all)")
+    parser.add_argument("-n", "--number", type=int, default=1000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", help="write JSON to this file")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario: {', '.join(unknown)}")
+    results = run_all(args.names, number=args.number, repeat=args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
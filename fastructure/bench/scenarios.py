@@ -0,0 +1,369 @@
+import dataclasses
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from functools import singledispatchmethod
+from typing import Annotated
+
+from fastructure import structured
+from fastructure.bench import scenario
+from fastructure.typehints import AutoConvert
+
+BULK_ROWS = 1000
+STARTUP_MODELS = 100
+
+STARTUP_FIELDS = [
+    ("name", str),
+    ("age", int),
+    ("score", float),
+    ("birthday", datetime),
+    ("tags", list[str]),
+]
+
+
+def _source(typehint) -> str:
+    # builtins and datetime, imported by the script.
+    return typehint.__name__ if isinstance(typehint, type) else repr(typehint)
+
+
+# run in a new interpreter, so the import is not cached.
+STARTUP_SCRIPT = f"""
+import dataclasses
+from datetime import datetime
+
+from fastructure import structured
+
+FIELDS = [{", ".join(f"({name!r}, {_source(t)})" for name, t in STARTUP_FIELDS)}]
+
+for i in range({STARTUP_MODELS}):
+    structured(convert_all=True)(
+        dataclasses.make_dataclass(f"Model{{i}}", FIELDS, frozen=True)
+    )
+"""
+
+
+@structured()
+@dataclasses.dataclass(frozen=True)
+class Flat:
+    name: str
+    age: int
+    score: float
+    active: bool
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Converted:
+    name: str
+    age: int
+    score: float
+    birthday: datetime
+    updated_at: datetime
+
+
+@structured(convert_all=True, conversion_cache=1024)
+@dataclasses.dataclass(frozen=True)
+class CachedConverted:
+    name: str
+    age: int
+    score: float
+    birthday: datetime
+    updated_at: datetime
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True, slots=True)
+class SlottedConverted:
+    name: str
+    age: int
+    score: float
+    birthday: datetime
+    updated_at: datetime
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Location:
+    name: str
+    code: int
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Author:
+    name: str
+    birthday: datetime
+    locations: list[Location]
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Book:
+    title: str
+    authors: list[Author]
+
+
+@structured()
+@dataclasses.dataclass(frozen=True)
+class Cleaned:
+    name: str
+    first_name: str
+    last_name: str
+    age: int
+    debut: int
+    birthday: datetime
+
+    @classmethod
+    def clean_name(cls, first_name: str, last_name: str) -> str:
+        return f"{first_name} {last_name}"
+
+    @classmethod
+    def clean_first_name(cls, first_name: str) -> str:
+        return first_name.strip()
+
+    @classmethod
+    def clean_last_name(cls, last_name: str) -> str:
+        return last_name.strip()
+
+    @staticmethod
+    def clean_age(age: int, birthday: Annotated[datetime, AutoConvert]) -> int:
+        return min(age, datetime.now().year - birthday.year)
+
+    @singledispatchmethod
+    @classmethod
+    def clean_debut(cls, debut: int) -> int:
+        return debut
+
+    @clean_debut.register
+    @classmethod
+    def _(cls, debut: str) -> int:
+        return int(debut.removesuffix("y"))
+
+    @singledispatchmethod
+    @classmethod
+    def clean_birthday(cls, birthday: datetime) -> datetime:
+        return birthday
+
+    @clean_birthday.register
+    @classmethod
+    def _(cls, birthday: str) -> datetime:
+        return datetime.strptime(birthday, "%Y-%m-%d")
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass()
+class WithInitVar:
+    name: str
+    timestamp: dataclasses.InitVar[int]
+    offset: dataclasses.InitVar[int]
+    created_at: datetime = dataclasses.field(init=False)
+
+    def __post_init__(self, timestamp: int, offset: int):
+        self.created_at = datetime.fromtimestamp(timestamp) + timedelta(hours=offset)
+
+
+class WideCleaners:
+    # a third of the fields are cleaned, each cleaner also receives `rate`.
+    @classmethod
+    def clean_f0(cls, f0: int, rate: float) -> int:
+        return int(f0 * rate)
+
+    @classmethod
+    def clean_f1(cls, f1: int, rate: float) -> int:
+        return int(f1 * rate)
+
+    @classmethod
+    def clean_f2(cls, f2: int, rate: float) -> int:
+        return int(f2 * rate)
+
+    @classmethod
+    def clean_f3(cls, f3: int, rate: float) -> int:
+        return int(f3 * rate)
+
+    @classmethod
+    def clean_f4(cls, f4: int, rate: float) -> int:
+        return int(f4 * rate)
+
+    @classmethod
+    def clean_f5(cls, f5: int, rate: float) -> int:
+        return int(f5 * rate)
+
+    @classmethod
+    def clean_f6(cls, f6: int, rate: float) -> int:
+        return int(f6 * rate)
+
+    @classmethod
+    def clean_f7(cls, f7: int, rate: float) -> int:
+        return int(f7 * rate)
+
+    @classmethod
+    def clean_f8(cls, f8: int, rate: float) -> int:
+        return int(f8 * rate)
+
+    @classmethod
+    def clean_f9(cls, f9: int, rate: float) -> int:
+        return int(f9 * rate)
+
+
+Wide = structured()(
+    dataclasses.make_dataclass(
+        "Wide",
+        [(f"f{i}", int) for i in range(30)] + [("rate", float)],
+        bases=(WideCleaners,),
+        frozen=True,
+    )
+)
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Profile:
+    # birthday is converted once, although three steps take it.
+    birthday: datetime
+    age: int
+    weekday: str
+
+    @classmethod
+    def clean_age(cls, birthday: datetime) -> int:
+        return 2024 - birthday.year
+
+    @classmethod
+    def clean_weekday(cls, birthday: datetime) -> str:
+        return birthday.strftime("%A")
+
+
+FLAT_ROW = {"name": "John", "age": 20, "score": 1.5, "active": True}
+CONVERTED_ROW = {
+    "name": "John",
+    "age": "20",
+    "score": "1.5",
+    "birthday": "2000-01-01",
+    "updated_at": "2024-01-01T12:30:00",
+}
+# the same row, already typed by the caller.
+TYPED_ROW = {
+    "name": "John",
+    "age": 20,
+    "score": 1.5,
+    "birthday": datetime(2000, 1, 1),
+    "updated_at": datetime(2024, 1, 1, 12, 30),
+}
+BOOK_ROW = {
+    "title": "Book",
+    "authors": [
+        {
+            "name": f"Author {i}",
+            "birthday": "1990-01-01",
+            "locations": [{"name": "Tokyo", "code": "1"}, {"name": "Osaka", "code": 2}],
+        }
+        for i in range(10)
+    ],
+}
+CLEANED_ROW = {
+    "first_name": "  John ",
+    "last_name": " Doe  ",
+    "age": 20,
+    "debut": "2010y",
+    "birthday": "2000-01-01",
+}
+WIDE_ROW = {f"f{i}": i for i in range(30)} | {"rate": 1.5}
+
+
+@scenario("flat.construct")
+def flat_construct():
+    return lambda: Flat.construct(**FLAT_ROW)
+
+
+@scenario("flat.from_dict")
+def flat_from_dict():
+    return lambda: Flat.from_dict(FLAT_ROW)
+
+
+@scenario("flat.from_list")
+def flat_from_list():
+    row = list(FLAT_ROW.values())
+    return lambda: Flat.from_list(row)
+
+
+@scenario("convert_all.from_dict")
+def convert_all_from_dict():
+    return lambda: Converted.from_dict(CONVERTED_ROW)
+
+
+@scenario("typed.from_dict")
+def typed_from_dict():
+    return lambda: Converted.from_dict(TYPED_ROW)
+
+
+@scenario("nested.from_dict")
+def nested_from_dict():
+    return lambda: Book.from_dict(BOOK_ROW)
+
+
+@scenario("clean_methods.construct")
+def clean_methods_construct():
+    return lambda: Cleaned.construct(**CLEANED_ROW)
+
+
+@scenario("wide.construct")
+def wide_construct():
+    return lambda: Wide.construct(**WIDE_ROW)
+
+
+@scenario("shared_conversion.construct")
+def shared_conversion_construct():
+    return lambda: Profile.construct(birthday="2000-01-01T12:30:00+09:00")
+
+
+@scenario("init_var.construct")
+def init_var_construct():
+    return lambda: WithInitVar.construct(name="John", timestamp="1000000000", offset=9)
+
+
+@scenario("bulk.from_dicts", ops_per_call=BULK_ROWS)
+def bulk_from_dicts():
+    rows = [CONVERTED_ROW] * BULK_ROWS
+    return lambda: Converted.from_dicts(rows)
+
+
+@scenario("bulk.from_dicts_cached", ops_per_call=BULK_ROWS)
+def bulk_from_dicts_cached():
+    rows = [CONVERTED_ROW] * BULK_ROWS
+    return lambda: CachedConverted.from_dicts(rows)
+
+
+# compare retained_bytes_per_call: the instances are kept until measured.
+@scenario("memory.dict_instances", ops_per_call=BULK_ROWS)
+def memory_dict_instances():
+    rows = [CONVERTED_ROW] * BULK_ROWS
+    return lambda: Converted.from_dicts(rows)
+
+
+@scenario("memory.slots_instances", ops_per_call=BULK_ROWS)
+def memory_slots_instances():
+    rows = [CONVERTED_ROW] * BULK_ROWS
+    return lambda: SlottedConverted.from_dicts(rows)
+
+
+@scenario("bulk.from_dict_loop", ops_per_call=BULK_ROWS)
+def bulk_from_dict_loop():
+    rows = [CONVERTED_ROW] * BULK_ROWS
+    return lambda: [Converted.from_dict(row) for row in rows]
+
+
+# decoration only, the dataclasses are made once.
+@scenario("startup.decorate", ops_per_call=STARTUP_MODELS)
+def startup_decorate():
+    dataclasses_ = [
+        dataclasses.make_dataclass(f"Model{i}", STARTUP_FIELDS, frozen=True)
+        for i in range(STARTUP_MODELS)
+    ]
+    decorate = structured(convert_all=True)
+    return lambda: [decorate(dataclass_) for dataclass_ in dataclasses_]
+
+
+# import + decoration of STARTUP_MODELS models, interpreter startup included.
+@scenario("startup.import", max_number=3)
+def startup_import():
+    command = [sys.executable, "-c", STARTUP_SCRIPT]
+    return lambda: subprocess.run(command, check=True)
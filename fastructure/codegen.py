@@ -0,0 +1,144 @@
+"""
+Generates specialized `from_dict` / `from_list` functions for plain models,
+the same way `dataclasses` generates `__init__`.
+
+A model is plain when it has no clean_* methods, keeps the default `clean`,
+has no lazy fields and its `__init__` takes keyword arguments only.
+Key lookups, the missing-key check and conversions are then inlined
+into a single function.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Type
+
+from fastructure.base import BaseModel
+from fastructure.index import MapIndex
+from fastructure.lazy import LazyReference
+
+if TYPE_CHECKING:
+    from fastructure.plan import ConstructionPlan
+
+
+def can_compile(model: Type[BaseModel]) -> bool:
+    plan: "ConstructionPlan" = model._get_plan()
+    if plan.implied_keys or plan.clean_steps or not model._has_default_clean():
+        return False
+    binding = plan.init_binding
+    if binding.pos_only or binding.has_var_keyword:
+        return False
+    return not any(isinstance(ref, LazyReference) for ref in model._references)
+
+
+LOADERS = ("from_dict", "_from_dict_index", "from_list", "_from_list_index")
+
+
+def install(model: Type[BaseModel]) -> None:
+    """
+    replace the generic loaders of `model` by generated ones.
+    code is generated on first call, as maps may refer to models defined later
+    and the plan telling whether the model can be compiled is not built yet.
+    models which cannot be compiled go back to the generic loaders.
+    """
+    for name in LOADERS:
+        setattr(model, name, classmethod(_compile_on_first_call(name)))
+
+
+def _compile_on_first_call(name: str) -> Callable:
+    def compile_and_call(cls: Type[BaseModel], *args, **kwargs):
+        if getattr(cls, name).__func__ is compile_and_call:
+            if can_compile(cls):
+                compile_loaders(cls)
+            else:
+                for loader in LOADERS:
+                    delattr(cls, loader)
+        return getattr(cls, name)(*args, **kwargs)
+
+    compile_and_call.__name__ = name
+    return compile_and_call
+
+
+def compile_loaders(model: Type[BaseModel]):
+    from_dict = _build(model, "dict", model._dict_index())
+    from_list = _build(model, "list", model._list_index())
+    model.from_dict = classmethod(from_dict)
+    model._from_dict_index = classmethod(_ignore_index(from_dict))
+    model.from_list = classmethod(from_list)
+    model._from_list_index = classmethod(_ignore_index(from_list))
+
+
+def _ignore_index(func: Callable) -> Callable:
+    # the index is already inlined in the generated code.
+    def from_index(cls, index, data):
+        return func(cls, data)
+
+    from_index.__name__ = f"_{func.__name__}_index"
+    return from_index
+
+
+def _raise_missing(cls: Type[BaseModel], data: dict, keys: Iterable):
+    for key in keys:
+        if key not in data:
+            raise cls.ValidationError(
+                f"{key} is required to make a instance of '{cls.__name__}'"
+            )
+    raise
+
+
+def _build(model: Type[BaseModel], kind: str, index: MapIndex) -> Callable:
+    config = model._config
+    binding = model._get_plan().init_binding
+    namespace: dict[str, Any] = {
+        "_convert": config._convert,
+        "_passes": config._converter_class.passes_through,
+        "_parse": config._recursive_parse,
+        "_raise_missing": _raise_missing,
+        "_keys": tuple(key for key, _ in index),
+    }
+
+    lines = []
+    arguments: dict[str, str] = {}
+    for i, (key, var_name) in enumerate(index):
+        if kind == "dict":
+            namespace[f"_k{i}"] = key
+            lines.append(f"v{i} = data[_k{i}]")
+        else:
+            lines.append(f"v{i} = data[{int(key)}]")
+        if var_name not in binding.param_names:
+            # dropped before calling __init__, same as the generic path.
+            continue
+
+        value = f"v{i}"
+        annotation = binding.annotations[var_name]
+        if config._is_convertible(annotation):
+            if annotation.has_args or annotation.is_annotated or annotation.is_init_var:
+                namespace[f"_a{i}"] = annotation.analysis
+                value = f"_parse(v{i}, _a{i})"
+            else:
+                namespace[f"_t{i}"] = annotation.origin
+                # values already of the type are kept, same as Config.parse.
+                value = (
+                    f"v{i} if v{i}.__class__ is _t{i} and _passes(_t{i}) "
+                    f"else _convert(v{i}, _t{i})"
+                )
+        arguments[var_name] = value
+
+    body = [f"def from_{kind}(cls, data):"]
+    if kind == "dict":
+        body += ["    try:"]
+        body += [f"        {line}" for line in lines] or ["        pass"]
+        body += ["    except KeyError:", "        _raise_missing(cls, data, _keys)"]
+    else:
+        body += [
+            f"    if len(data) < {index.length}:",
+            "        raise cls.ValidationError(",
+            "            f\"class '{cls.__name__}' must have \"",
+            '            f"a list map with length {len(data)}"',
+            "        )",
+        ]
+        body += [f"    {line}" for line in lines]
+    call = ", ".join(f"{name}={value}" for name, value in arguments.items())
+    body += [f"    return cls({call})"]
+
+    exec("\n".join(body), namespace)
+    func = namespace[f"from_{kind}"]
+    func.__qualname__ = f"{model.__qualname__}.from_{kind}"
+    return func
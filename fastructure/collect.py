@@ -0,0 +1,136 @@
+"""
+`collect_errors` mode: building an instance goes on after a failure,
+so every missing key, failed conversion and failed clean method of a row,
+including those of nested models, is raised at once as `ValidationErrors`.
+
+Each failure is located by a path such as `Book.authors[3].birthday`.
+Nested models are collected whatever their own config is.
+Models with async clean methods raise TypeError, `aconstruct` and `afrom_dict` included.
+
+The instance is built by `ConstructionPlan._execute` and `Config._recursive_parse`,
+which hand their failures to a `Collector` instead of raising them.
+"""
+
+from typing import TYPE_CHECKING, Type
+
+from fastructure.base import BaseModel
+from fastructure.exceptions import FieldError, ValidationErrors
+from fastructure.index import MapIndex
+
+if TYPE_CHECKING:
+    from fastructure.plan import FieldStep
+
+
+def install(model: Type[BaseModel]) -> None:
+    """
+    replace the loaders and `_construct` of `model` by collecting ones.
+    """
+    model._from_dict_index = classmethod(_from_dict_index)
+    model._from_list_index = classmethod(_from_list_index)
+    model._construct = classmethod(_construct)
+
+
+class Collector:
+    """
+    The failures of a value being built, located from `path`.
+    Collectors of the values and nested models of a row share its list of errors.
+    """
+
+    __slots__ = ("errors", "path", "missing", "count")
+
+    def __init__(self, errors: list[FieldError], path: str):
+        self.errors = errors
+        self.path = path
+        # fields without a value, already reported.
+        self.missing: set[str] = set()
+        # the errors reported before this value.
+        self.count = len(errors)
+
+    def at(self, suffix: str) -> "Collector":
+        return Collector(self.errors, self.path + suffix)
+
+    @property
+    def failed(self) -> bool:
+        return bool(self.missing) or len(self.errors) > self.count
+
+    def add(self, error: Exception, suffix: str = "") -> None:
+        add_error(self.errors, self.path + suffix, error)
+
+    def add_step(self, step: "FieldStep", error: Exception) -> None:
+        binding = step.binding
+        # a clean method taking a missing value only fails because of it.
+        if binding.has_var_keyword or self.missing.isdisjoint(binding.param_names):
+            self.add(error, f".{step.field_name}")
+
+    def map_dict(self, model: Type[BaseModel], index: MapIndex[str], data: dict):
+        kwargs = {}
+        for key, var_name in index.pairs:
+            try:
+                kwargs[var_name] = data[key]
+            except KeyError:
+                self._add_missing(
+                    model, var_name, f"{key} is required to make a instance of"
+                )
+        return kwargs
+
+    def map_list(self, model: Type[BaseModel], index: MapIndex[int], data: list):
+        kwargs = {}
+        for i, var_name in index.pairs:
+            if i < len(data):
+                kwargs[var_name] = data[i]
+            else:
+                self._add_missing(
+                    model, var_name, f"position {i} is required to make a instance of"
+                )
+        return kwargs
+
+    def _add_missing(self, model: Type[BaseModel], var_name: str, message: str):
+        self.missing.add(var_name)
+        self.add(model.ValidationError(f"{message} '{model.__name__}'"), f".{var_name}")
+
+    def build[Model: BaseModel](
+        self, model: Type[Model], value: dict | list
+    ) -> Model | None:
+        """
+        the nested `model` from its raw `value`, None if it could not be built.
+        """
+        nested = Collector(self.errors, self.path)
+        if value.__class__ is dict:
+            kwargs = nested.map_dict(model, model._dict_index(), value)
+        else:
+            kwargs = nested.map_list(model, model._list_index(), value)
+        return model._get_plan()._execute(kwargs, nested)
+
+
+def _raise_collected[Model: BaseModel](
+    model: Type[Model], kwargs: dict, errors: Collector
+) -> Model:
+    instance = model._get_plan()._execute(kwargs, errors)
+    if errors.errors:
+        raise ValidationErrors(model.__name__, errors.errors)
+    return instance
+
+
+def _from_dict_index(cls: Type[BaseModel], index: MapIndex[str], data: dict):
+    errors = Collector([], cls.__name__)
+    return _raise_collected(cls, errors.map_dict(cls, index, data), errors)
+
+
+def _from_list_index(cls: Type[BaseModel], index: MapIndex[int], data: list):
+    errors = Collector([], cls.__name__)
+    return _raise_collected(cls, errors.map_list(cls, index, data), errors)
+
+
+def _construct(cls: Type[BaseModel], **kwargs):
+    return _raise_collected(cls, kwargs, Collector([], cls.__name__))
+
+
+def add_error(errors: list[FieldError], path: str, error: Exception) -> None:
+    if isinstance(error, ValidationErrors):
+        # raised by a nested model built on its own, e.g. by a clean method.
+        errors.extend(
+            FieldError(path + e.path.removeprefix(error.model_name), e.error)
+            for e in error.errors
+        )
+    else:
+        errors.append(FieldError(path, error))
@@ -0,0 +1,151 @@
+"""
+Column-oriented storage for many instances of a plain model.
+
+Each `__init__` parameter of the model is stored as one NumPy array
+(int64, float64, bool and datetime64 where the values allow it, object otherwise),
+so loading many rows does not pay the per-instance dataclass overhead.
+Instances are only materialized when an item is accessed.
+"""
+
+import sys
+from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Type
+
+from fastructure import codegen
+from fastructure.parallel import Kind
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+if TYPE_CHECKING:
+    from fastructure.base import BaseModel
+
+DTYPES: dict[type, str] = {
+    int: "int64",
+    float: "float64",
+    bool: "bool",
+    datetime: "datetime64[us]",
+}
+
+
+def _pack(values: list, value_type: Any) -> "np.ndarray":
+    dtype = DTYPES.get(value_type)
+    if dtype is not None and all(type(value) is value_type for value in values):
+        try:
+            return np.array(values, dtype=dtype)
+        except (TypeError, ValueError, OverflowError):
+            # e.g. timezone aware datetimes or ints out of int64 range
+            pass
+
+    if value_type is str:
+        values = [
+            sys.intern(value) if type(value) is str else value for value in values
+        ]
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _to_python(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class ModelArray[Model: "BaseModel"]:
+    def __init__(self, model: Type[Model], columns: Mapping[str, "np.ndarray"]):
+        if np is None:
+            raise ImportError("ModelArray requires numpy. Run `pip install numpy`.")
+        if not codegen.can_compile(model):
+            raise TypeError(
+                f"ModelArray of '{model.__name__}' is not supported, "
+                "models with clean methods have to be built one by one."
+            )
+
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns must have the same length, got {lengths}.")
+
+        self._model = model
+        self._columns = dict(columns)
+        self._length = lengths.pop() if lengths else 0
+        for column in self._columns.values():
+            column.flags.writeable = False
+
+    @classmethod
+    def from_rows(
+        cls, model: Type[Model], rows: Iterable, kind: Kind = "dict"
+    ) -> "ModelArray[Model]":
+        """
+        build columns from dicts (`dict_map`) or lists (`list_map`),
+        converting a whole column at once with the model's Converter rules.
+        """
+        config = model._config
+        converter = config._converter_class
+        binding = model._get_plan().init_binding
+        if kind == "dict":
+            full_index, load = model._dict_index(), model._from_dict_index
+        else:
+            full_index, load = model._list_index(), model._from_list_index
+        index = [
+            (key, var_name)
+            for key, var_name in full_index
+            if var_name in binding.param_names
+        ]
+
+        raw: dict[str, list] = {var_name: [] for _, var_name in index}
+        for row in rows:
+            try:
+                for key, var_name in index:
+                    raw[var_name].append(row[key])
+            except (KeyError, IndexError):
+                # let the generic loader raise its ValidationError
+                load(full_index, row)
+                raise
+
+        columns = {}
+        for var_name, values in raw.items():
+            annotation = binding.annotations[var_name]
+            analysis = annotation.analysis
+            while analysis.is_annotated or analysis.is_init_var:
+                analysis = analysis.child(0)
+            if config._is_convertible(annotation):
+                values = (
+                    [config._recursive_parse(value, analysis) for value in values]
+                    if analysis.has_args
+                    else converter.execute_many(values, analysis.origin)
+                )
+            columns[var_name] = _pack(values, analysis.origin)
+        return cls(model, columns)
+
+    @property
+    def columns(self) -> Mapping[str, "np.ndarray"]:
+        return MappingProxyType(self._columns)
+
+    def __getattr__(self, name: str) -> "np.ndarray":
+        try:
+            return self.__dict__["_columns"][name]
+        except KeyError:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, item: int | slice) -> "Model | ModelArray[Model]":
+        if isinstance(item, slice):
+            return ModelArray(
+                self._model,
+                {name: column[item] for name, column in self._columns.items()},
+            )
+
+        return self._model(
+            **{name: _to_python(column[item]) for name, column in self._columns.items()}
+        )
+
+    def __iter__(self) -> Iterator[Model]:
+        for i in range(self._length):
+            yield self[i]
+
+    def __repr__(self):
+        return f"ModelArray[{self._model.__name__}](length={self._length})"
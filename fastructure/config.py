@@ -1,15 +1,25 @@
-from typing import TYPE_CHECKING, Annotated, Callable, Type, TypedDict
+import os
+from functools import lru_cache, partial
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Type, TypedDict
 
 from fastructure.converters import Converter
-from fastructure.reference import Annotation, Reference
+from fastructure.lazy import LazyValue
+from fastructure.reference import Analysis, Annotation, Reference
 
 if TYPE_CHECKING:
     from fastructure.base import BaseModel
+    from fastructure.collect import Collector
 
 CLEAN_METHOD_PREFIX = "clean_"
 DICT_MAP_METHOD_NAME = "dict_map"
 LIST_MAP_METHOD_NAME = "list_map"
 
+# converted values of these types are never shared, as they are mutable.
+MUTABLE_TYPES = frozenset({list, dict, set, bytearray})
+# raw values looked up in the conversion cache, hashable and never mutated.
+CACHEABLE_TYPES = frozenset({str, bytes, int, float, bool})
+
 
 type MapType = str | Reference | "BaseModel"
 
@@ -20,6 +30,11 @@ class ConfigType(TypedDict, total=False):
     convert_all: bool
     mapping_method: str
     class_itself_var_names: list[str] | None
+    compile: bool
+    lazy: bool
+    conversion_cache: int | None
+    collect_errors: bool
+    plan_cache: str | os.PathLike | None
 
 
 class Config:
@@ -32,6 +47,11 @@ class Config:
         list_map_method: str = LIST_MAP_METHOD_NAME,
         clean_method_prefix: str = CLEAN_METHOD_PREFIX,
         class_itself_var_names: list[str] | None = None,
+        compile: bool = False,
+        lazy: bool = False,
+        conversion_cache: int | None = None,
+        collect_errors: bool = False,
+        plan_cache: str | os.PathLike | None = None,
     ):
         self.clean_method_prefix = clean_method_prefix
         self.convert_all = convert_all
@@ -39,6 +59,20 @@ class Config:
         self.dict_map_method = dict_map_method
         self.list_map_method = list_map_method
         self.class_itself_var_names = ["cls"] + (class_itself_var_names or [])
+        # generate specialized from_dict / from_list when the model allows it
+        self.compile = compile
+        # build nested models of fields on first attribute access
+        self.lazy = lazy
+        # max number of converted values kept per target type, None to disable
+        self.conversion_cache = conversion_cache
+        # report every failure of an instance at once, instead of the first one
+        self.collect_errors = collect_errors
+        # directory keeping compiled construction plans across processes
+        self.plan_cache = plan_cache
+        self._cached_conversions: dict[Any, Callable | None] = {}
+        self._convert: Callable[[Any, Any], Any] = (
+            converter.convert if conversion_cache is None else self._convert_cached
+        )
 
     def _get_clean_method_name(self, field_name: str) -> str:
         return f"{self.clean_method_prefix}{field_name}"
@@ -71,26 +105,23 @@ class Config:
             raise
 
     def _is_convertible(self, annotation: Annotation) -> bool:
-        if self.convert_all:
-            return True
-
-        if annotation.is_init_var:
-            # For InitVar fields, check the inner annotation for AutoConvert
-            child = annotation.get_child_annotation(0)
-            return child.origin is Annotated and child.has_auto_convert
+        return self.convert_all or annotation.analysis.is_auto_convertible
 
-        if annotation.origin is not Annotated:
-            return False
+    def parse_lazily(self, value, annotation: Annotation):
+        if not self._is_convertible(annotation):
+            return value
 
-        return annotation.has_auto_convert
+        return LazyValue(self._recursive_parse, value, annotation.analysis)
 
-    def parse(self, value, annotation: Annotation):
-        if not self._is_convertible(annotation):
+    def parse(self, value, annotation: Annotation, errors: "Collector | None" = None):
+        if not self._is_convertible(annotation) or value.__class__ is LazyValue:
             return value
 
-        return self._recursive_parse(value, annotation)
+        return self._recursive_parse(value, annotation.analysis, errors)
 
-    def _recursive_parse(self, value, annotation: Annotation):
+    def _recursive_parse(
+        self, value, analysis: Analysis, errors: "Collector | None" = None
+    ):
         """
         expected typehint:
             var: Annotated[int, ...]
@@ -99,16 +130,84 @@ class Config:
             var: int
             var: BaseModel
             var: list[BaseModel]
+
+        with `errors`, failures are collected instead of raised and None is returned.
+        """
+        if analysis.is_annotated or analysis.is_init_var:
+            return self._recursive_parse(value, analysis.child(0), errors)
+
+        # values already of the target type are kept as they are, and containers
+        # are only rebuilt if one of their values changed.
+        origin = analysis.origin
+        try:
+            if analysis.args:
+                values = None
+                for i, val in enumerate(value):
+                    at = None if errors is None else errors.at(f"[{i}]")
+                    parsed = self._recursive_parse(val, analysis.child(i), at)
+                    if values is None:
+                        if parsed is val:
+                            continue
+                        values = list(islice(value, i))
+                    values.append(parsed)
+                if errors is not None and errors.failed:
+                    return None
+                if values is not None:
+                    return self._convert(value.__class__(values), origin)
+                # mutable containers are still copied, callers may modify them.
+                immutable = value.__class__ is origin and origin not in MUTABLE_TYPES
+                if immutable and self._converter_class.passes_through(origin):
+                    return value
+                return self._convert(value.__class__(value), origin)
+
+            if errors is not None:
+                raw = value.__class__ in (dict, list)
+                if raw and analysis.is_fastructure_model:
+                    # nested models collect their own failures.
+                    return errors.build(origin, value)
+            same_type = value.__class__ is origin
+            if same_type and self._converter_class.passes_through(origin):
+                return value
+            return self._convert(value, origin)
+        except Exception as e:
+            if errors is None:
+                raise
+            errors.add(e)
+            return None
+
+    def _convert_cached(self, value, to_type):
+        if value.__class__ is to_type:
+            # usually nothing to do, not worth a slot in the cache.
+            return self._converter_class.convert(value, to_type)
+        try:
+            cached = self._cached_conversions[to_type]
+        except KeyError:
+            cached = self._cached_conversions[to_type] = self._cache_conversion(to_type)
+        if cached is None or value.__class__ not in CACHEABLE_TYPES:
+            return self._converter_class.convert(value, to_type)
+        return cached(value)
+
+    def _cache_conversion(self, to_type) -> Callable | None:
+        from fastructure.base import BaseModel
+
+        if not isinstance(to_type, type) or to_type in MUTABLE_TYPES:
+            return None
+        if issubclass(to_type, BaseModel):
+            return None
+        # typed, so that 1, 1.0 and True are cached separately.
+        return lru_cache(maxsize=self.conversion_cache, typed=True)(
+            partial(self._converter_class.convert, to_type=to_type)
+        )
+
+    def conversion_cache_info(self) -> dict[type, tuple[int, int, int, int]]:
+        """
+        (hits, misses, maxsize, currsize) per target type, see functools.lru_cache.
         """
-        if annotation.is_annotated or annotation.is_init_var:
-            return self._recursive_parse(value, annotation.get_child_annotation(0))
-        if annotation.has_args:
-            return self._converter_class(
-                value.__class__(
-                    self._recursive_parse(val, annotation.get_child_annotation(i))
-                    for i, val in enumerate(value)
-                ),
-                annotation.origin,
-            ).execute()
-
-        return self._converter_class(value, annotation.origin).execute()
+        return {
+            to_type: cached.cache_info()
+            for to_type, cached in self._cached_conversions.items()
+            if cached is not None
+        }
+
+    def clear_conversion_cache(self) -> None:
+        self._cached_conversions.clear()
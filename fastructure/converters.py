@@ -1,118 +1,389 @@
 from datetime import datetime
-from functools import singledispatchmethod
-from typing import TYPE_CHECKING, Any, Type
+from functools import cache, partial
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Type
 
 from fastructure.exceptions import ConvertError
 
 if TYPE_CHECKING:
     from fastructure.base import BaseModel
 
+type Conversion = Callable[[Any], Any]
+
+# target types whose conversion used to be spelled as a `to_*` method.
+# Subclasses overriding one of these methods keep being called for that target.
+METHOD_NAMES: dict[type, str] = {
+    str: "to_str",
+    int: "to_int",
+    float: "to_float",
+    bool: "to_bool",
+    datetime: "to_datetime",
+    list: "to_list",
+    tuple: "to_tuple",
+}
+BASE_MODEL_METHOD_NAME = "to_base_model"
+
+# below this many values NumPy's setup costs more than it saves.
+NUMPY_MIN_VALUES = 256
+# NumPy calls int() / float() on these exactly like the default conversions.
+NUMPY_SOURCE_TYPES = frozenset({str, int, float, bool})
+
+
+@cache
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _to_base_model(to_type: Type["BaseModel"], value: Any) -> "BaseModel":
+    if isinstance(value, to_type):
+        # converter may run several times.
+        # So check if may already values are converted.
+        return value
+    return (
+        to_type.from_dict(value)
+        if isinstance(value, dict)
+        else to_type.from_list(value)
+    )
+
 
 class Converter[ToType]:
+    """
+    Converts values with a `(source type, target type) -> function` table.
+
+    The table is looked up with the MRO of the source type, so a conversion
+    registered for `int` also applies to `bool`. Resolved functions are cached
+    per converter class, so converting a value allocates nothing.
+    """
+
+    _conversions: ClassVar[dict[Any, dict[type, Conversion]]] = {}
+    _dispatch: ClassVar[dict[tuple[type, Any], Conversion]] = {}
+    _passes_through: ClassVar[dict[type, bool]] = {}
+    _legacy: ClassVar[bool] = False
+
     def __init__(self, value: Any, to_type: Type[ToType]):
         self._value = value
         self._to_type = to_type
 
-    def _execute(self) -> ToType:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._conversions = {}
+        cls._dispatch = {}
+        cls._passes_through = {}
+        # subclasses overriding execute itself have to be instantiated per value.
+        cls._legacy = cls._overrides("execute") or cls._overrides("_execute")
+
+    @classmethod
+    def _overrides(cls, name: str) -> bool:
+        return any(
+            name in klass.__dict__
+            for klass in cls.__mro__
+            if klass is not Converter and issubclass(klass, Converter)
+        )
+
+    @classmethod
+    def register(
+        cls, from_type: type, to_type: Any
+    ) -> Callable[[Conversion], Conversion]:
+        """
+        register a function converting `from_type` values to `to_type`.
+        ex.
+        @Converter.register(str, Decimal)
+        def _(value: str) -> Decimal:
+        """
+
+        def decorator(func: Conversion) -> Conversion:
+            cls._conversions.setdefault(to_type, {})[from_type] = func
+            cls._clear_dispatch()
+            return func
+
+        return decorator
+
+    @classmethod
+    def _clear_dispatch(cls):
+        cls._dispatch.clear()
+        cls._passes_through.clear()
+        for subclass in cls.__subclasses__():
+            subclass._clear_dispatch()
+
+    @classmethod
+    def _lookup(cls, from_type: type, to_type: Any) -> Conversion | None:
+        converters = [
+            klass.__dict__["_conversions"]
+            for klass in cls.__mro__
+            if "_conversions" in klass.__dict__
+        ]
+        for source in from_type.__mro__:
+            for conversions in converters:
+                try:
+                    return conversions[to_type][source]
+                except KeyError:
+                    continue
+        return None
+
+    @classmethod
+    def _registered(cls, from_type: type, to_type: Any) -> Conversion:
         from fastructure.base import BaseModel
 
-        if self._to_type is str:
-            return self.to_str(self._value)
-        elif self._to_type is int:
-            return self.to_int(self._value)
-        elif self._to_type is float:
-            return self.to_float(self._value)
-        elif self._to_type is bool:
-            return self.to_bool(self._value)
-        elif self._to_type is datetime:
-            return self.to_datetime(self._value)
-        elif self._to_type is list:
-            return self.to_list(self._value)
-        elif self._to_type is tuple:
-            return self.to_tuple(self._value)
-        elif issubclass(self._to_type, BaseModel):
-            return self.to_base_model(self._value)
-        return self._value
+        if (conversion := cls._lookup(from_type, to_type)) is not None:
+            return conversion
+        if isinstance(to_type, type) and issubclass(to_type, BaseModel):
+            return partial(_to_base_model, to_type)
+        return _identity
 
-    def execute(self) -> ToType:
+    @classmethod
+    def _resolve(cls, from_type: type, to_type: Any) -> Conversion:
         try:
-            return self._execute()
+            return cls._dispatch[from_type, to_type]
+        except KeyError:
+            pass
+
+        from fastructure.base import BaseModel
+
+        method_name = METHOD_NAMES.get(to_type)
+        if method_name is None and (
+            isinstance(to_type, type) and issubclass(to_type, BaseModel)
+        ):
+            method_name = BASE_MODEL_METHOD_NAME
+
+        if method_name is not None and cls._overrides(method_name):
+            conversion = partial(cls._call_method, method_name, to_type)
+        else:
+            conversion = cls._registered(from_type, to_type)
+        cls._dispatch[from_type, to_type] = conversion
+        return conversion
+
+    @classmethod
+    def passes_through(cls, to_type: type) -> bool:
+        """
+        True if values already of exactly `to_type` are converted to themselves,
+        so callers may keep them as they are.
+        conversions registered or methods overridden for `to_type` never pass.
+        """
+        try:
+            return cls._passes_through[to_type]
+        except KeyError:
+            pass
+
+        conversion = None if cls._legacy else cls._resolve(to_type, to_type)
+        passes = cls._passes_through[to_type] = conversion in PASS_THROUGH or (
+            isinstance(conversion, partial) and conversion.func is _to_base_model
+        )
+        return passes
+
+    @classmethod
+    def _call_method(cls, method_name: str, to_type: Any, value: Any) -> Any:
+        return getattr(cls(value, to_type), method_name)(value)
+
+    @classmethod
+    def convert(cls, value: Any, to_type: Type[ToType]) -> ToType:
+        if cls._legacy:
+            return cls(value, to_type).execute()
+
+        try:
+            return cls._resolve(value.__class__, to_type)(value)
         except ValueError as e:
             raise ConvertError(str(e))
 
-    def to_base_model(self, value: Any) -> "BaseModel":
-        if isinstance(value, self._to_type):
-            # converter may run several times.
-            # So check if may already values are converted.
-            return value
-        return (
-            self._to_type.from_dict(value)
-            if isinstance(value, dict)
-            else self._to_type.from_list(value)
-        )
+    @classmethod
+    def execute_many(cls, values: Iterable, to_type: Type[ToType]) -> list[ToType]:
+        """
+        convert every value to `to_type`, same as calling `convert` one by one.
+        the conversion is resolved once per source type, and large str/number
+        columns are converted to int or float by NumPy if it is installed.
+        ConvertError.index tells which value failed.
+        """
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        if len(values) >= NUMPY_MIN_VALUES:
+            result = cls._execute_many_numpy(values, to_type)
+            if result is not None:
+                return result
 
-    @singledispatchmethod
-    def to_str(self, value) -> str:
-        return str(value)
+        resolve = cls._resolve_legacy if cls._legacy else cls._resolve
+        conversions: dict[type, Conversion] = {}
+        result = []
+        try:
+            for value in values:
+                value_type = value.__class__
+                try:
+                    conversion = conversions[value_type]
+                except KeyError:
+                    conversion = conversions[value_type] = resolve(value_type, to_type)
+                result.append(conversion(value))
+        except ValueError as e:
+            raise ConvertError(str(e), index=len(result))
+        return result
 
-    @to_str.register
-    def _(self, value: datetime) -> str:
-        return value.isoformat()
+    @classmethod
+    def _resolve_legacy(cls, from_type: type, to_type: Any) -> Conversion:
+        return partial(cls._execute_legacy, to_type)
 
-    @to_str.register
-    def _(self, value: bool) -> str:
-        return "yes" if value else "no"
+    @classmethod
+    def _execute_legacy(cls, to_type: Any, value: Any) -> Any:
+        return cls(value, to_type).execute()
 
-    @to_str.register
-    def _(self, _: None) -> str:
-        return ""
+    @classmethod
+    def _execute_many_numpy(cls, values: list, to_type: Any) -> list | None:
+        if (np := _numpy()) is None or cls._legacy:
+            return None
 
-    @singledispatchmethod
-    def to_int(self, value: int) -> int:
-        return int(value)
+        dtype, default = NUMPY_CONVERSIONS.get(to_type, (None, None))
+        if dtype is None:
+            return None
+        value_types = set(map(type, values))
+        if not value_types <= NUMPY_SOURCE_TYPES or any(
+            cls._resolve(value_type, to_type) is not default
+            for value_type in value_types
+        ):
+            return None
 
-    @to_int.register
-    def _(self, value: datetime) -> int:
-        return int(value.timestamp())
+        try:
+            return np.array(values, dtype=object).astype(dtype).tolist()
+        except (ValueError, TypeError, OverflowError):
+            # let the plain loop find the failed value and raise the usual error
+            return None
 
-    @singledispatchmethod
-    def to_float(self, value) -> float:
-        return float(value)
+    def _execute(self) -> ToType:
+        return self._resolve(self._value.__class__, self._to_type)(self._value)
 
-    @to_float.register
-    def _(self, value: datetime) -> float:
-        return value.timestamp()
+    def execute(self) -> ToType:
+        try:
+            return self._execute()
+        except ValueError as e:
+            raise ConvertError(str(e))
+
+    def _registered_method(self, value: Any, to_type: type) -> Any:
+        return self._registered(value.__class__, to_type)(value)
 
-    @singledispatchmethod
-    def to_bool(self, _) -> bool:
-        return bool(self._value)
+    def to_base_model(self, value: Any) -> "BaseModel":
+        return _to_base_model(self._to_type, value)
 
-    @to_bool.register(str)
-    def _(self, value: str) -> bool:
-        return value.lower() == "yes"
+    def to_str(self, value) -> str:
+        return self._registered_method(value, str)
 
-    @singledispatchmethod
-    def to_datetime(self, value) -> datetime:
-        raise NotImplementedError(f"Cannot convert {type(value)} to datetime")
+    def to_int(self, value) -> int:
+        return self._registered_method(value, int)
 
-    @to_datetime.register(int)
-    @to_datetime.register(float)
-    def _(self, value: int | float) -> datetime:
-        return datetime.fromtimestamp(value)
+    def to_float(self, value) -> float:
+        return self._registered_method(value, float)
 
-    @to_datetime.register(str)
-    def _(self, value: str) -> datetime:
-        return datetime.fromisoformat(value)
+    def to_bool(self, value) -> bool:
+        return self._registered_method(value, bool)
 
-    @to_datetime.register(datetime)
-    def _(self, value: datetime) -> datetime:
-        return value
+    def to_datetime(self, value) -> datetime:
+        return self._registered_method(value, datetime)
 
     def to_list(self, value) -> list:
-        return list(value)
+        return self._registered_method(value, list)
 
     def to_tuple(self, value) -> tuple:
-        return tuple(value)
+        return self._registered_method(value, tuple)
 
     def to_set(self, value) -> set:
         return set(value)
+
+
+@Converter.register(object, str)
+def _to_str(value) -> str:
+    return str(value)
+
+
+@Converter.register(datetime, str)
+def _(value: datetime) -> str:
+    return value.isoformat()
+
+
+@Converter.register(bool, str)
+def _(value: bool) -> str:
+    return "yes" if value else "no"
+
+
+@Converter.register(bytes, str)
+def _(value: bytes) -> str:
+    # fixed-width fields of binary records are padded with NUL bytes.
+    return value.rstrip(b"\0").decode()
+
+
+@Converter.register(type(None), str)
+def _(_: None) -> str:
+    return ""
+
+
+@Converter.register(object, int)
+def _to_int(value) -> int:
+    return int(value)
+
+
+@Converter.register(datetime, int)
+def _(value: datetime) -> int:
+    return int(value.timestamp())
+
+
+@Converter.register(object, float)
+def _to_float(value) -> float:
+    return float(value)
+
+
+@Converter.register(datetime, float)
+def _(value: datetime) -> float:
+    return value.timestamp()
+
+
+@Converter.register(object, bool)
+def _to_bool(value) -> bool:
+    return bool(value)
+
+
+@Converter.register(str, bool)
+def _(value: str) -> bool:
+    return value.lower() == "yes"
+
+
+@Converter.register(object, datetime)
+def _(value) -> datetime:
+    raise NotImplementedError(f"Cannot convert {type(value)} to datetime")
+
+
+@Converter.register(int, datetime)
+@Converter.register(float, datetime)
+def _(value: int | float) -> datetime:
+    return datetime.fromtimestamp(value)
+
+
+@Converter.register(str, datetime)
+def _(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+@Converter.register(datetime, datetime)
+def _same_datetime(value: datetime) -> datetime:
+    return value
+
+
+@Converter.register(object, list)
+def _to_list(value) -> list:
+    return list(value)
+
+
+@Converter.register(object, tuple)
+def _to_tuple(value) -> tuple:
+    return tuple(value)
+
+
+# default conversions returning a value already of the target type as it is,
+# so such values need no conversion. lists are copied, so they are not listed.
+PASS_THROUGH: frozenset[Conversion] = frozenset(
+    {_identity, _to_str, _to_int, _to_float, _to_bool, _same_datetime, _to_tuple}
+)
+
+# target type -> (NumPy dtype, conversion NumPy can replace)
+NUMPY_CONVERSIONS: dict[type, tuple[str, Conversion]] = {
+    int: ("int64", _to_int),
+    float: ("float64", _to_float),
+}
@@ -1,9 +1,90 @@
 import dataclasses
-from typing import Callable, Type, Unpack
+import weakref
+from typing import Any, Callable, Iterable, Type, Unpack
 
+from fastructure import codegen, collect
 from fastructure.base import BaseModel
 from fastructure.config import ConfigType
-from fastructure.reference import Reference
+from fastructure.lazy import LazyReference, LazySlotReference
+from fastructure.plan import ConstructionPlan
+from fastructure.reference import Reference, SlotReference, analyse
+from fastructure.typehints import Lazy
+
+
+def _is_lazy(cls: Type[BaseModel], field: dataclasses.Field) -> bool:
+    analysis = analyse(field.type)
+    if analysis.is_init_var or not analysis.has_fastructure_model:
+        return False
+    if not cls._has_default_clean():
+        # a custom clean has to receive the built models
+        return False
+
+    return cls._config.lazy or (analysis.is_annotated and Lazy in analysis.args)
+
+
+def _slot(cls: Type[BaseModel], name: str) -> Any:
+    # the member descriptor created by `__slots__`, if the field is a slot.
+    for klass in cls.__mro__[1:]:
+        if name in klass.__dict__.get("__slots__", ()):
+            return klass.__dict__[name]
+    return None
+
+
+def _reference(
+    cls: Type[BaseModel], field: dataclasses.Field, slotted: bool
+) -> Reference:
+    lazy = _is_lazy(cls, field)
+    if slotted and (slot := _slot(cls, field.name)) is not None:
+        return (LazySlotReference if lazy else SlotReference)(
+            cls=cls, cls_var_name=field.name, typehint=field.type, slot=slot
+        )
+    return (LazyReference if lazy else Reference)(
+        cls=cls, cls_var_name=field.name, typehint=field.type
+    )
+
+
+# models decorated but not used yet, prepared by `warmup()`.
+_pending: weakref.WeakSet = weakref.WeakSet()
+
+
+class _DeferredPlan:
+    """
+    stands for the ConstructionPlan of a model until it is first accessed,
+    then compiles it for the class it is accessed on and replaces itself there.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, instance, owner) -> ConstructionPlan:
+        return prepare(owner)
+
+
+def prepare(model: Type[BaseModel]) -> ConstructionPlan:
+    """
+    compile the ConstructionPlan of `model` unless it already is.
+    """
+    # looked up on the class itself, subclasses have plans of their own.
+    plan = model.__dict__.get("_plan")
+    if plan is None or plan.__class__ is _DeferredPlan:
+        if model._config.plan_cache is None:
+            plan = ConstructionPlan.compile(model)
+        else:
+            from fastructure import plan_cache
+
+            plan = plan_cache.compile(model)
+        model._plan = plan
+        _pending.discard(model)
+    return plan
+
+
+def warmup(models: Iterable[Type[BaseModel]] | None = None) -> None:
+    """
+    compile the construction plans of `models` now instead of on first use,
+    e.g. at startup or in a background thread.
+    every model decorated so far is prepared if `models` is None.
+    """
+    for model in list(_pending) if models is None else models:
+        prepare(model)
 
 
 def structured[T](
@@ -16,20 +97,32 @@ def structured[T](
         if issubclass(dataclass_, BaseModel):
             cls = dataclass_
         else:
-            cls = type(dataclass_.__name__, (dataclass_, BaseModel), {}, **kwargs)
+            # keep the module and qualname of the dataclass,
+            # so the model and its instances can be pickled by reference.
+            namespace = {
+                "__module__": dataclass_.__module__,
+                "__qualname__": dataclass_.__qualname__,
+            }
+            if "__slots__" in dataclass_.__dict__:
+                # @dataclass(slots=True): keep the instances free of __dict__.
+                namespace["__slots__"] = ()
+            cls = type(
+                dataclass_.__name__, (dataclass_, BaseModel), namespace, **kwargs
+            )
 
         # Use __dataclass_fields__ to include InitVar fields
         fields = cls.__dataclass_fields__.values()
-        cls._references = tuple(
-            Reference(
-                cls=cls,
-                cls_var_name=field.name,
-                typehint=field.type,
-            )
-            for field in fields
-        )
+        slotted = "__dict__" not in dir(cls)
+        cls._references = tuple(_reference(cls, field, slotted) for field in fields)
         for ref in cls._references:
             setattr(cls, ref.cls_var_name, ref)
+        # the plan and its signature bindings are compiled on first use.
+        cls._plan = _DeferredPlan()
+        _pending.add(cls)
+        if cls._config.collect_errors:
+            collect.install(cls)
+        elif cls._config.compile:
+            codegen.install(cls)
 
         return cls
 
@@ -0,0 +1,67 @@
+import dataclasses
+from typing import TYPE_CHECKING, Any, Self, Type
+
+from fastructure.converters import Converter
+
+if TYPE_CHECKING:
+    from fastructure.base import BaseModel
+
+# values of these types are written out as they are.
+NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Dumper:
+    """
+    dict_map / list_map inverted into (key, field name) pairs.
+    Keys mapped to something other than a field of the model
+    (e.g. the arguments of a clean method) cannot be dumped and are left out.
+    """
+
+    dict_index: tuple[tuple[str, str], ...]
+    list_index: tuple[tuple[int, str], ...]
+    list_length: int
+    converter: Type[Converter]
+
+    @classmethod
+    def compile(cls, model: Type["BaseModel"]) -> Self:
+        field_names = {field.name for field in dataclasses.fields(model)}
+        list_index = model._list_index()
+        return cls(
+            dict_index=tuple(
+                (key, var_name)
+                for key, var_name in model._dict_index()
+                if var_name in field_names
+            ),
+            list_index=tuple(
+                (i, var_name) for i, var_name in list_index if var_name in field_names
+            ),
+            list_length=list_index.length,
+            converter=model._config._converter_class,
+        )
+
+    def to_dict(self, instance: "BaseModel") -> dict:
+        return {
+            key: self.dump(getattr(instance, var_name), as_dict=True)
+            for key, var_name in self.dict_index
+        }
+
+    def to_list(self, instance: "BaseModel") -> list:
+        result = [None] * self.list_length
+        for i, var_name in self.list_index:
+            result[i] = self.dump(getattr(instance, var_name), as_dict=False)
+        return result
+
+    def dump(self, value: Any, as_dict: bool) -> Any:
+        from fastructure.base import BaseModel
+
+        value_type = value.__class__
+        if value_type in NATIVE_TYPES:
+            return value
+        if isinstance(value, BaseModel):
+            return value.to_dict() if as_dict else value.to_list()
+        if value_type is list or value_type is tuple:
+            return value_type(self.dump(val, as_dict) for val in value)
+        if value_type is dict:
+            return {key: self.dump(val, as_dict) for key, val in value.items()}
+        return self.converter.convert(value, str)
@@ -3,7 +3,68 @@ class ValidationError(Exception):
 
 
 class ConvertError(ValidationError, ValueError):
-    pass
+    def __init__(self, message: str, index: int | None = None):
+        super().__init__(message)
+        # position of the failed value when converting many values at once
+        self.index = index
+
+    def __reduce__(self):
+        return self.__class__, (str(self), self.index)
+
+
+class RowError(ValidationError):
+    """
+    Raised (or collected) when one row of a bulk load fails.
+    """
+
+    def __init__(self, index: int, error: Exception):
+        self.index = index
+        self.error = error
+        super().__init__(f"row {index}: {error}")
+        self.__cause__ = error
+
+    def __reduce__(self):
+        return self.__class__, (self.index, self.error)
+
+
+class FieldError(ValidationError):
+    """
+    A single failure, located by a path such as `Book.authors[3].birthday`.
+    """
+
+    def __init__(self, path: str, error: Exception):
+        self.path = path
+        self.error = error
+        super().__init__(f"{path}: {error}")
+        self.__cause__ = error
+
+    def __reduce__(self):
+        return self.__class__, (self.path, self.error)
+
+
+class ValidationErrors(ValidationError):
+    """
+    Raised in `collect_errors` mode with every failure of an instance.
+    """
+
+    def __init__(self, model_name: str, errors: list[FieldError]):
+        self.model_name = model_name
+        self.errors = errors
+        lines = [f"{len(errors)} validation error(s) for '{model_name}'"]
+        lines.extend(str(error) for error in errors)
+        super().__init__("\n".join(lines))
+
+    def __reduce__(self):
+        return self.__class__, (self.model_name, self.errors)
+
+    def to_dict(self) -> dict[str, list[str]]:
+        """
+        error messages by path.
+        """
+        result: dict[str, list[str]] = {}
+        for error in self.errors:
+            result.setdefault(error.path, []).append(str(error.error))
+        return result
 
 
 class InvalidParameterName(Exception):
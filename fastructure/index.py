@@ -0,0 +1,39 @@
+import dataclasses
+from typing import Iterator, Mapping, Self, Sequence
+
+from fastructure.reference import Reference
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MapIndex[Key]:
+    """
+    dict_map / list_map resolved into (source key or position, var name) pairs.
+    iterating over an index yields the pairs.
+    """
+
+    pairs: tuple[tuple[Key, str], ...]
+    # for list maps, the shortest list holding every position.
+    length: int
+
+    @classmethod
+    def of_dict_map(cls, dict_map: Mapping) -> Self:
+        return cls(pairs=_resolve(dict_map), length=len(dict_map))
+
+    @classmethod
+    def of_list_map(cls, list_map: Mapping | Sequence) -> Self:
+        if not isinstance(list_map, Mapping):
+            list_map = dict(enumerate(list_map))
+        return cls(pairs=_resolve(list_map), length=max(list_map, default=-1) + 1)
+
+    def __iter__(self) -> Iterator[tuple[Key, str]]:
+        return iter(self.pairs)
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+
+def _resolve(map_: Mapping) -> tuple:
+    return tuple(
+        (key, ref.cls_var_name if isinstance(ref, Reference) else ref)
+        for key, ref in map_.items()
+    )
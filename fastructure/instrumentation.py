@@ -0,0 +1,131 @@
+"""
+Opt-in timings of the construction hot path.
+
+While a Recorder is enabled, every synchronous construction records
+how long each step took, per model and per field:
+
+- "map": picking the values of a row out with dict_map / list_map
+- "clean": a clean_* method (per field) or `clean` (field is None)
+- "convert": parsing / converting a field without a clean method
+- "init": the final `__init__` call
+
+Timings are inclusive, a nested model being converted is also recorded
+under its own model. Compiled loaders and async construction are not recorded.
+When disabled, the hot path only checks `recorder is None`.
+"""
+
+import dataclasses
+from contextlib import contextmanager
+from typing import Any, Iterator, Literal, Mapping, Type
+
+type Phase = Literal["map", "clean", "convert", "init"]
+type Key = tuple[str, Phase, str | None]
+
+# the enabled Recorder, None when instrumentation is disabled.
+recorder: "Recorder | None" = None
+
+
+@dataclasses.dataclass(slots=True)
+class Timing:
+    calls: int = 0
+    total_ns: int = 0
+
+    def to_dict(self) -> dict[str, int | float]:
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total_ns / 1e9,
+            "mean_seconds": self.total_ns / self.calls / 1e9 if self.calls else 0.0,
+        }
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Stats:
+    """
+    a snapshot of recorded timings keyed on (model, phase, field).
+    """
+
+    timings: Mapping[Key, Timing]
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        {model: {phase: {field: timing}}}. timings of the whole model,
+        such as `clean` or `__init__`, are stored under the field "*".
+        """
+        result: dict[str, Any] = {}
+        for (model, phase, field), timing in sorted(
+            self.timings.items(), key=lambda item: (item[0][0], item[0][1])
+        ):
+            phases = result.setdefault(model, {})
+            phases.setdefault(phase, {})[field or "*"] = timing.to_dict()
+        return result
+
+    def to_json(self, **kwargs) -> str:
+        import json
+
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+class Recorder:
+    """
+    collects timings. subclass and override `record` to forward them elsewhere.
+    """
+
+    def __init__(self):
+        import threading
+
+        self._timings: dict[Key, Timing] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self, model: Type, phase: Phase, field: str | None, elapsed_ns: int
+    ) -> None:
+        key = (f"{model.__module__}.{model.__qualname__}", phase, field)
+        with self._lock:
+            timing = self._timings.get(key)
+            if timing is None:
+                timing = self._timings[key] = Timing()
+            timing.calls += 1
+            timing.total_ns += elapsed_ns
+
+    def snapshot(self) -> Stats:
+        with self._lock:
+            return Stats(
+                {key: dataclasses.replace(t) for key, t in self._timings.items()}
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._timings.clear()
+
+
+def enable(new_recorder: Recorder | None = None) -> Recorder:
+    global recorder
+    recorder = new_recorder or Recorder()
+    return recorder
+
+
+def disable() -> None:
+    global recorder
+    recorder = None
+
+
+@contextmanager
+def recording(new_recorder: Recorder | None = None) -> Iterator[Recorder]:
+    """
+    enable instrumentation inside a `with` block, restoring the previous state.
+    """
+    global recorder
+    previous = recorder
+    try:
+        yield enable(new_recorder)
+    finally:
+        recorder = previous
+
+
+def stats() -> Stats:
+    """
+    timings of the enabled Recorder, empty if instrumentation is disabled.
+    """
+    if recorder is None:
+        return Stats({})
+    return recorder.snapshot()
@@ -0,0 +1,79 @@
+from typing import Any, Callable
+
+from fastructure.reference import Reference, SlotReference
+
+
+def _loaded(value: Any) -> Any:
+    return value
+
+
+class LazyValue:
+    """
+    Raw data of a field plus the call that turns it into models.
+    It is stored on the instance and replaced by the result on first access.
+    """
+
+    __slots__ = ("_load", "_args")
+
+    def __init__(self, load: Callable, *args):
+        self._load = load
+        self._args = args
+
+    def get(self) -> Any:
+        return self._load(*self._args)
+
+    def __reduce__(self):
+        # pickle the loaded value, not the loader
+        return _loaded, (self.get(),)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._args[0]!r})"
+
+
+class LazyReference(Reference):
+    """
+    Reference of a field holding nested models which are built on first access.
+    As a data descriptor it sees every access to the field on an instance,
+    so only lazy fields pay for it.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        name = self._cls_var_name
+        try:
+            value = instance.__dict__[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{owner.__name__}' object has no attribute '{name}'"
+            ) from None
+
+        if value.__class__ is LazyValue:
+            value = instance.__dict__[name] = value.get()
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._cls_var_name] = value
+
+    def __delete__(self, instance):
+        try:
+            del instance.__dict__[self._cls_var_name]
+        except KeyError:
+            raise AttributeError(self._cls_var_name) from None
+
+
+class LazySlotReference(SlotReference, LazyReference):
+    """
+    LazyReference of a slotted model, the value is kept in the slot.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = self._slot.__get__(instance, owner)
+        if value.__class__ is LazyValue:
+            value = value.get()
+            self._slot.__set__(instance, value)
+        return value
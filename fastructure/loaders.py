@@ -0,0 +1,177 @@
+import csv
+import json
+import mmap
+import os
+import struct
+from collections.abc import Buffer
+from contextlib import contextmanager
+from datetime import datetime
+from typing import IO, TYPE_CHECKING, Iterator, Mapping, Type
+
+from fastructure.exceptions import RowError
+
+if TYPE_CHECKING:
+    from fastructure.base import BaseModel
+
+# files are read in large chunks, rows are still handed out one by one.
+BUFFER_SIZE = 1024 * 1024
+
+# struct formats of binary records derived from annotations, datetimes are epochs.
+STRUCT_FORMATS: dict[type, str] = {int: "q", float: "d", bool: "?", datetime: "d"}
+
+type Source = str | os.PathLike | IO[str]
+type BinarySource = str | os.PathLike | Buffer
+
+
+@contextmanager
+def _open(source: Source, **kwargs) -> Iterator[IO[str]]:
+    if not isinstance(source, (str, os.PathLike)):
+        # file objects are owned by the caller, so they are not closed here.
+        yield source
+        return
+
+    with open(source, buffering=BUFFER_SIZE, encoding="utf-8", **kwargs) as f:
+        yield f
+
+
+def iter_jsonl[Model: "BaseModel"](
+    model: Type[Model],
+    source: Source,
+    *,
+    errors: list[RowError] | None = None,
+) -> Iterator[Model]:
+    """
+    lazily build an instance per JSON line using `dict_map`. blank lines are skipped,
+    and RowError.index is the 0-based line number in the file.
+    """
+    index = model._dict_index()
+    with _open(source) as f:
+        for i, line in enumerate(f):
+            if line.isspace():
+                continue
+            try:
+                instance = model._from_dict_index(index, json.loads(line))
+            except Exception as e:
+                if errors is None:
+                    raise
+                errors.append(RowError(index=i, error=e))
+                continue
+            yield instance
+
+
+def iter_csv[Model: "BaseModel"](
+    model: Type[Model],
+    source: Source,
+    *,
+    header: bool = True,
+    errors: list[RowError] | None = None,
+    **fmtparams,
+) -> Iterator[Model]:
+    """
+    lazily build an instance per CSV row.
+    rows are mapped with `dict_map` if the file has a header, otherwise `list_map`.
+    """
+    with _open(source, newline="") as f:
+        if header:
+            yield from model._iter_rows(
+                model._from_dict_index,
+                model._dict_index(),
+                csv.DictReader(f, **fmtparams),
+                errors,
+            )
+        else:
+            yield from model._iter_rows(
+                model._from_list_index,
+                model._list_index(),
+                csv.reader(f, **fmtparams),
+                errors,
+            )
+
+
+def struct_formats(model: Type["BaseModel"]) -> dict[int, str]:
+    """
+    the default `buffer_map`: a struct format per list_map position,
+    derived from the annotation of the field at that position.
+    """
+    references = {ref.cls_var_name: ref for ref in model._references}
+    formats = {}
+    for position, var_name in model._list_index():
+        origin = None
+        if var_name in references:
+            analysis = references[var_name].analysis
+            while analysis.is_annotated or analysis.is_init_var:
+                analysis = analysis.child(0)
+            origin = analysis.origin
+        if (format_ := STRUCT_FORMATS.get(origin)) is None:
+            raise TypeError(
+                f"the struct format of '{model.__name__}.{var_name}' "
+                "cannot be derived, declare it in `buffer_map`."
+            )
+        formats[position] = format_
+    return formats
+
+
+def record_struct(model: Type["BaseModel"], byte_order: str = "<") -> struct.Struct:
+    """
+    the layout of a single record, unpacked into a row for `list_map`.
+    """
+    formats = model.buffer_map()
+    if not isinstance(formats, Mapping):
+        formats = dict(enumerate(formats))
+    length = max(model._list_index().length, max(formats, default=-1) + 1)
+    try:
+        record = struct.Struct(byte_order + "".join(formats[i] for i in range(length)))
+    except KeyError as e:
+        raise TypeError(f"`buffer_map` of '{model.__name__}' has no position {e}.")
+    # positions of the unpacked values have to be those of list_map.
+    if len(record.unpack(bytes(record.size))) != length:
+        raise TypeError(
+            f"each format of the `buffer_map` of '{model.__name__}' "
+            "must hold a single value."
+        )
+    return record
+
+
+@contextmanager
+def _map(source: BinarySource) -> Iterator[Buffer]:
+    if not isinstance(source, (str, os.PathLike)):
+        # buffers are owned by the caller.
+        yield source
+        return
+
+    with open(source, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files cannot be mapped.
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def iter_buffer[Model: "BaseModel"](
+    model: Type[Model],
+    source: BinarySource,
+    *,
+    byte_order: str = "<",
+    errors: list[RowError] | None = None,
+) -> Iterator[Model]:
+    """
+    lazily build an instance per fixed-size record of a binary buffer,
+    such as bytes, a memoryview or an mmap. files given by path are memory-mapped.
+    records are unpacked in place with `buffer_map` and mapped with `list_map`.
+    """
+    record = record_struct(model, byte_order)
+    with _map(source) as buffer:
+        with memoryview(buffer) as view:
+            nbytes = view.nbytes
+        if nbytes % record.size:
+            raise model.ValidationError(
+                f"a buffer of {nbytes} bytes does not hold whole records "
+                f"of {record.size} bytes for '{model.__name__}'"
+            )
+        yield from model._iter_rows(
+            model._from_list_index,
+            model._list_index(),
+            record.iter_unpack(buffer),
+            errors,
+        )
@@ -0,0 +1,74 @@
+import pickle
+from itertools import batched, count, repeat
+from typing import TYPE_CHECKING, Iterable, Literal, Type
+
+from fastructure.exceptions import RowError
+
+if TYPE_CHECKING:
+    from fastructure.base import BaseModel
+
+type Kind = Literal["dict", "list"]
+
+
+def _check_picklable(model: Type["BaseModel"]):
+    try:
+        pickle.dumps(model)
+    except (pickle.PicklingError, AttributeError) as e:
+        raise TypeError(
+            f"'{model.__qualname__}' must be defined at module level "
+            "to be built in worker processes."
+        ) from e
+
+
+def _build_chunk[Model: "BaseModel"](
+    model: Type[Model], kind: Kind, start: int, rows: tuple
+) -> tuple[list[Model], list[RowError]]:
+    errors = []
+    build = model.from_dicts if kind == "dict" else model.from_lists
+    instances = build(rows, errors=errors)
+    return instances, [
+        RowError(index=start + error.index, error=error.error) for error in errors
+    ]
+
+
+def build_in_workers[Model: "BaseModel"](
+    model: Type[Model],
+    kind: Kind,
+    rows: Iterable,
+    *,
+    workers: int,
+    chunksize: int,
+    errors: list[RowError] | None,
+) -> list[Model]:
+    """
+    build instances in a process pool, `chunksize` rows per task.
+    the order of rows is preserved. if `errors` is None, the error of the first
+    failed row is raised as in a single process, with a note giving the row index.
+    """
+    # imported here, process pools are slow to import and rarely used.
+    from concurrent.futures import ProcessPoolExecutor
+
+    _check_picklable(model)
+
+    results = []
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for instances, chunk_errors in executor.map(
+            _build_chunk,
+            repeat(model),
+            repeat(kind),
+            count(0, chunksize),
+            batched(rows, chunksize),
+        ):
+            if chunk_errors:
+                if errors is None:
+                    first = chunk_errors[0]
+                    first.error.add_note(f"raised by row {first.index}")
+                    raise first.error
+                errors.extend(chunk_errors)
+            results.extend(instances)
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+    return results
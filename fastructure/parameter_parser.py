@@ -1,70 +1,208 @@
 import inspect
+import weakref
 from functools import cached_property
-from typing import Any, Callable
+from typing import Any, Callable, Mapping, Self
 
 from fastructure.config import Config
 from fastructure.exceptions import InvalidParameterName
-from fastructure.reference import Annotation
+from fastructure.reference import Analysis, Annotation
 
+# conversions shared within a single construction, keyed on (name, annotation).
+type Memo = dict[tuple[str, Analysis], Any]
 
-class ParameterParser[**P]:
-    def __init__(
-        self,
-        method: Callable,
-        config: Config,
-        params: P.kwargs,
-    ):
-        self._config = config
-        self._method = method
-        self._parameters = inspect.signature(method).parameters
-        self._params = params
+# Bindings are keyed on the underlying function (or class) object, so redefining
+# a class produces new keys and the stale entries are dropped with the old class.
+_bindings: weakref.WeakKeyDictionary[Any, dict[Config, "Binding"]] = (
+    weakref.WeakKeyDictionary()
+)
 
-    @property
-    def _is_single_dispatch(self) -> bool:
-        return hasattr(self._method, "register")
 
-    @property
-    def _field_name(self) -> str:
-        return self._config.substring_field_name(self._method.__name__)
+class Binding:
+    """
+    Precomputed knowledge about how to call a method with a dict of values.
+    """
 
-    def _sub_kwargs(self, **kwargs: P.kwargs) -> tuple[list, dict]:
-        # if method has **kwargs, return all kwargs
-        if any(p.kind == p.VAR_KEYWORD for p in self._parameters.values()):
-            if self._is_single_dispatch:
-                # singledispatchmethod required only one parameter
-                return [kwargs[self._field_name]], {
-                    k: v for k, v in kwargs.items() if k != self._field_name
-                }
-            return [], kwargs
+    __slots__ = (
+        "method_name",
+        "annotations",
+        "has_var_keyword",
+        "is_single_dispatch",
+        "dispatch_name",
+        "param_names",
+        "pos_only",
+    )
+
+    def __init__(self, method: Callable, config: Config):
+        parameters = inspect.signature(method).parameters
+        self.method_name: str = method.__name__
+        self.annotations: dict[str, Annotation] = {
+            k: Annotation(typehint=p.annotation) for k, p in parameters.items()
+        }
+        self.has_var_keyword = any(p.kind == p.VAR_KEYWORD for p in parameters.values())
+        self.is_single_dispatch = hasattr(method, "register")
+        self.dispatch_name: str | None = None
+        if self.has_var_keyword and self.is_single_dispatch:
+            self.dispatch_name = config.substring_field_name(method.__name__)
 
         param_names = [
             k
-            for k, p in self._parameters.items()
+            for k, p in parameters.items()
             if p.kind != p.VAR_KEYWORD and p.kind != p.VAR_POSITIONAL
         ]
-        pos_only = [
-            k for k, p in self._parameters.items() if p.kind == p.POSITIONAL_ONLY
-        ]
+        pos_only = [k for k, p in parameters.items() if p.kind == p.POSITIONAL_ONLY]
         # if method has cls, remove it from param_names
-        if isinstance(self._method, classmethod) or self._is_single_dispatch:
+        if isinstance(method, classmethod) or self.is_single_dispatch:
             # it's impossible to check if method is classmethod or staticmethod wrapped
             # by singledispatchmethod, so we check if method has "register" attribute
             # and remove "cls" from param_names
-            if param_names[0] in self._config.class_itself_var_names:
+            if param_names and param_names[0] in config.class_itself_var_names:
                 param_names = param_names[1:]
-        if self._is_single_dispatch and not pos_only:
+        if self.is_single_dispatch and not pos_only and param_names:
             # singledispatchmethod required at least one positional argument
             pos_only = [param_names[0]]
-        param_names = [p for p in param_names if p in kwargs]
+        self.param_names: tuple[str, ...] = tuple(param_names)
+        self.pos_only: frozenset[str] = frozenset(pos_only)
+
+    @classmethod
+    def of(cls, method: Callable, config: Config, spec: dict | None = None) -> Self:
+        """
+        `spec` is the output of `to_spec` for the same method,
+        saving the signature inspection.
+        """
+        key = inspect.unwrap(getattr(method, "__func__", method))
         try:
-            return [kwargs[p] for p in param_names if p in pos_only], {
-                p: kwargs[p] for p in param_names if p not in pos_only
-            }
-        except KeyError as e:
-            raise InvalidParameterName(
-                f"Method '{self._method.__name__}' has no parameter named: "
-                f"{str(e).replace('KeyError: ', '')}"
+            per_config = _bindings.setdefault(key, {})
+        except TypeError:
+            # not weak-referenceable, nothing to cache on
+            return cls._build(method, config, spec)
+
+        try:
+            return per_config[config]
+        except KeyError:
+            binding = per_config[config] = cls._build(method, config, spec)
+            return binding
+
+    @classmethod
+    def _build(cls, method: Callable, config: Config, spec: dict | None) -> Self:
+        if spec is None:
+            return cls(method, config)
+
+        # annotations are looked up by name, as inspect.signature would return them.
+        target = method.__init__ if isinstance(method, type) else method
+        annotations = getattr(target, "__annotations__", {})
+        binding = cls.__new__(cls)
+        binding.method_name = method.__name__
+        binding.annotations = {
+            name: Annotation(typehint=annotations.get(name, inspect.Parameter.empty))
+            for name in spec["params"]
+        }
+        binding.has_var_keyword = spec["has_var_keyword"]
+        binding.is_single_dispatch = hasattr(method, "register")
+        binding.dispatch_name = spec["dispatch_name"]
+        binding.param_names = tuple(spec["param_names"])
+        binding.pos_only = frozenset(spec["pos_only"])
+        return binding
+
+    def to_spec(self) -> dict:
+        """
+        the signature knowledge of this binding as plain, JSON serializable data.
+        """
+        return {
+            "params": list(self.annotations),
+            "has_var_keyword": self.has_var_keyword,
+            "dispatch_name": self.dispatch_name,
+            "param_names": list(self.param_names),
+            "pos_only": sorted(self.pos_only),
+        }
+
+    def convert(self, config: Config, params: Mapping) -> dict:
+        annotations = self.annotations
+        return {
+            k: (
+                config.parse(value=v, annotation=annotations[k])
+                if k in annotations
+                else v
             )
+            for k, v in params.items()
+        }
+
+    def split(self, kwargs: dict) -> tuple[list, dict]:
+        # if method has **kwargs, return all kwargs
+        if self.has_var_keyword:
+            if self.is_single_dispatch:
+                # singledispatchmethod required only one parameter
+                try:
+                    dispatched = kwargs[self.dispatch_name]
+                except KeyError as e:
+                    raise InvalidParameterName(
+                        f"Method '{self.method_name}' has no parameter named: "
+                        f"{str(e).replace('KeyError: ', '')}"
+                    )
+                return [dispatched], {
+                    k: v for k, v in kwargs.items() if k != self.dispatch_name
+                }
+            return [], kwargs
+
+        pos_only = self.pos_only
+        args, named = [], {}
+        for p in self.param_names:
+            if p not in kwargs:
+                continue
+            if p in pos_only:
+                args.append(kwargs[p])
+            else:
+                named[p] = kwargs[p]
+        return args, named
+
+    def gather(
+        self,
+        config: Config,
+        params: Mapping,
+        memo: Memo | None = None,
+        memoized: frozenset[str] = frozenset(),
+    ) -> tuple[list, dict]:
+        """
+        conversions of the parameters in `memoized` are shared through `memo`
+        with the other methods that convert the same value to the same annotation.
+        """
+        if self.has_var_keyword:
+            return self.split(self.convert(config, params))
+
+        # only the values this method takes are looked up and converted.
+        annotations, pos_only = self.annotations, self.pos_only
+        args, named = [], {}
+        for p in self.param_names:
+            if p not in params:
+                continue
+            annotation = annotations[p]
+            if p in memoized:
+                key = (p, annotation.analysis)
+                try:
+                    value = memo[key]
+                except KeyError:
+                    value = memo[key] = config.parse(
+                        value=params[p], annotation=annotation
+                    )
+            else:
+                value = config.parse(value=params[p], annotation=annotation)
+            if p in pos_only:
+                args.append(value)
+            else:
+                named[p] = value
+        return args, named
+
+
+class ParameterParser[**P]:
+    def __init__(
+        self,
+        method: Callable,
+        config: Config,
+        params: P.kwargs,
+    ):
+        self._config = config
+        self._method = method
+        self._binding = Binding.of(method, config)
+        self._params = params
 
     @property
     def list_params(self) -> list:
@@ -76,13 +214,4 @@ class ParameterParser[**P]:
 
     @cached_property
     def _parsed(self) -> tuple[list, dict]:
-        params = {k: self._convert(k, v) for k, v in self._params.items()}
-        return self._sub_kwargs(**params)
-
-    def _convert(self, field_name: str, value: Any) -> Any:
-        try:
-            annotation = Annotation(typehint=self._parameters[field_name].annotation)
-        except KeyError:
-            return value
-
-        return self._config.parse(value=value, annotation=annotation)
+        return self._binding.gather(self._config, self._params)
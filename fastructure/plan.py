@@ -0,0 +1,424 @@
+import dataclasses
+import inspect
+from time import perf_counter_ns
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Self, Type
+
+from fastructure import instrumentation
+from fastructure.base import BaseModel
+from fastructure.config import MUTABLE_TYPES, Config
+from fastructure.lazy import LazyReference
+from fastructure.parameter_parser import Binding, Memo
+from fastructure.reference import Annotation, Reference
+
+if TYPE_CHECKING:
+    from fastructure.collect import Collector
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FieldStep:
+    """
+    How a single incoming value is turned into a constructor argument.
+    Either a clean method is called, or the value is parsed against its reference.
+    """
+
+    field_name: str
+    clean_method: Callable | None = None
+    binding: Binding | None = None
+    reference: Reference | None = None
+    # values converted the same way by another step, looked up in the memo.
+    memoized: frozenset[str] = frozenset()
+
+    def run(
+        self,
+        value: Any,
+        original_values: Mapping[str, Any],
+        config: Config,
+        memo: Memo | None = None,
+        errors: "Collector | None" = None,
+    ) -> Any:
+        if self.clean_method is None:
+            if errors is not None:
+                # parsed now, so nested models report their failures with the row.
+                errors = errors.at(f".{self.field_name}")
+                return config.parse(
+                    value=value, annotation=self.reference, errors=errors
+                )
+            if isinstance(self.reference, LazyReference):
+                return config.parse_lazily(value=value, annotation=self.reference)
+            if self.memoized:
+                key = (self.field_name, self.reference.analysis)
+                if key not in memo:
+                    memo[key] = config.parse(value=value, annotation=self.reference)
+                return memo[key]
+            return config.parse(value=value, annotation=self.reference)
+
+        args, kwargs = self.binding.gather(config, original_values, memo, self.memoized)
+        return self.clean_method(*args, **kwargs)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ConstructionPlan:
+    """
+    Everything `BaseModel._construct` needs to know about a model,
+    resolved once, when the model is first used.
+    """
+
+    model: Type[BaseModel]
+    steps: Mapping[str, FieldStep]
+    # `steps` split by kind, clean_* methods have to run before any conversion.
+    clean_steps: tuple[FieldStep, ...]
+    convert_steps: tuple[FieldStep, ...]
+    implied_keys: tuple[str, ...]
+    # True if a value is converted the same way by several steps.
+    has_memo: bool
+    # None if the model keeps the default `clean`, which returns its input.
+    clean: Callable[..., dict] | None
+    clean_binding: Binding
+    init_binding: Binding
+    # True if `clean` or any clean_* method is a coroutine function.
+    is_async: bool = False
+
+    @classmethod
+    def compile(cls, model: Type[BaseModel]) -> Self:
+        config = model._config
+        references = {ref.cls_var_name: ref for ref in model._references}
+
+        field_names = list(references)
+        implied_keys = []
+        for attr_name in dir(model):
+            try:
+                field_name = config.substring_field_name(attr_name)
+            except ValueError:
+                continue
+
+            if field_name not in field_names:
+                field_names.append(field_name)
+            # only methods bound to the class make their field required,
+            # as `inspect.getmembers(model, inspect.ismethod)` used to do.
+            if inspect.ismethod(getattr(model, attr_name, None)):
+                implied_keys.append(field_name)
+
+        steps = {}
+        for field_name in field_names:
+            try:
+                clean_method = config.get_clean_method(field_name, model)
+            except AttributeError:
+                if field_name in references:
+                    steps[field_name] = FieldStep(
+                        field_name=field_name, reference=references[field_name]
+                    )
+                continue
+
+            if callable(clean_method):
+                steps[field_name] = FieldStep(
+                    field_name=field_name,
+                    clean_method=clean_method,
+                    binding=Binding.of(clean_method, config),
+                )
+
+        steps = _memoize_shared_conversions(steps, config)
+        return cls._of_steps(
+            model,
+            steps,
+            implied_keys=tuple(implied_keys),
+            clean_binding=Binding.of(model.clean, config),
+            init_binding=Binding.of(model, config),
+            is_async=any(
+                _is_coroutine_method(method)
+                for method in (
+                    model.clean,
+                    *(step.clean_method for step in steps.values()),
+                )
+                if method is not None
+            ),
+        )
+
+    @classmethod
+    def _of_steps(cls, model: Type[BaseModel], steps: dict, **kwargs) -> Self:
+        # the fields derived from the steps, shared by compile and from_spec.
+        return cls(
+            model=model,
+            steps=MappingProxyType(steps),
+            clean_steps=tuple(
+                step for step in steps.values() if step.clean_method is not None
+            ),
+            convert_steps=tuple(
+                step for step in steps.values() if step.clean_method is None
+            ),
+            has_memo=any(step.memoized for step in steps.values()),
+            clean=None if model._has_default_clean() else model.clean,
+            **kwargs,
+        )
+
+    def to_spec(self) -> dict:
+        """
+        the compiled knowledge of this plan as plain, JSON serializable data.
+        methods and parameters are referred to by name,
+        so `from_spec` rebuilds the plan without inspecting the model again.
+        """
+        return {
+            "steps": [
+                {
+                    "field_name": step.field_name,
+                    "binding": step.binding and step.binding.to_spec(),
+                    "memoized": sorted(step.memoized),
+                }
+                for step in self.steps.values()
+            ],
+            "implied_keys": list(self.implied_keys),
+            "clean_binding": self.clean_binding.to_spec(),
+            "init_binding": self.init_binding.to_spec(),
+            "is_async": self.is_async,
+        }
+
+    @classmethod
+    def from_spec(cls, model: Type[BaseModel], spec: dict) -> Self:
+        """
+        rebuild the plan of `model` from `to_spec`.
+        raises AttributeError or KeyError if the spec does not fit the model.
+        """
+        config = model._config
+        references = {ref.cls_var_name: ref for ref in model._references}
+        steps = {}
+        for step in spec["steps"]:
+            field_name = step["field_name"]
+            memoized = frozenset(step["memoized"])
+            if step["binding"] is None:
+                steps[field_name] = FieldStep(
+                    field_name=field_name,
+                    reference=references[field_name],
+                    memoized=memoized,
+                )
+                continue
+
+            clean_method = config.get_clean_method(field_name, model)
+            steps[field_name] = FieldStep(
+                field_name=field_name,
+                clean_method=clean_method,
+                binding=Binding.of(clean_method, config, step["binding"]),
+                memoized=memoized,
+            )
+
+        return cls._of_steps(
+            model,
+            steps,
+            implied_keys=tuple(spec["implied_keys"]),
+            clean_binding=Binding.of(model.clean, config, spec["clean_binding"]),
+            init_binding=Binding.of(model, config, spec["init_binding"]),
+            is_async=spec["is_async"],
+        )
+
+    def __reduce__(self):
+        # pickled by spec, the model and its methods are pickled by reference.
+        return self.from_spec, (self.model, self.to_spec())
+
+    def execute(self, **kwargs) -> BaseModel:
+        return self._execute(kwargs)
+
+    def _execute(self, kwargs: dict, errors: "Collector | None" = None):
+        """
+        with `errors`, as in `collect_errors` mode, failures are collected
+        instead of raised, and None is returned if the instance is not built.
+        """
+        if self.is_async:
+            raise self._async_error()
+
+        if errors is None and instrumentation.recorder is not None:
+            return self._execute_recorded(instrumentation.recorder, kwargs)
+
+        # `kwargs` is the working record. clean_* methods read the original
+        # values through a view, conversions then replace values in place.
+        config = self.model._config
+        view = self._prepare(kwargs)
+        memo = {} if self.has_memo else None
+        cleaned = []
+        for step in self.clean_steps:
+            if (field_name := step.field_name) not in kwargs:
+                continue
+            try:
+                value = step.run(kwargs[field_name], view, config, memo)
+            except Exception as e:
+                if errors is None:
+                    raise
+                errors.add_step(step, e)
+            else:
+                cleaned.append((field_name, value))
+        for step in self.convert_steps:
+            if (field_name := step.field_name) in kwargs:
+                kwargs[field_name] = step.run(
+                    kwargs[field_name], view, config, memo, errors
+                )
+        kwargs.update(cleaned)
+
+        if errors is not None and errors.failed:
+            return None
+        try:
+            if self.clean is not None:
+                args, clean_kwargs = self.clean_binding.gather(config, view)
+                kwargs.update(self.clean(*args, **clean_kwargs))
+            args, init_kwargs = self.init_binding.gather(config, view)
+            return self.model(*args, **init_kwargs)
+        except Exception as e:
+            if errors is None:
+                raise
+            errors.add(e)
+            return None
+
+    def _async_error(self) -> TypeError:
+        name = self.model.__name__
+        if self.model._config.collect_errors:
+            return TypeError(
+                f"'{name}' has async clean methods, "
+                "which are not supported with collect_errors."
+            )
+        return TypeError(
+            f"'{name}' has async clean methods, "
+            f"use `await {name}.aconstruct(...)` instead."
+        )
+
+    def _prepare(self, kwargs: dict) -> Mapping[str, Any]:
+        for key in self.implied_keys:
+            if key not in kwargs:
+                kwargs[key] = None
+        return MappingProxyType(kwargs)
+
+    def _execute_recorded(
+        self, recorder: instrumentation.Recorder, kwargs: dict
+    ) -> BaseModel:
+        model = self.model
+        config = model._config
+        view = self._prepare(kwargs)
+        memo = {} if self.has_memo else None
+        cleaned = []
+        for step in (*self.clean_steps, *self.convert_steps):
+            if (field_name := step.field_name) not in kwargs:
+                continue
+            start = perf_counter_ns()
+            value = step.run(kwargs[field_name], view, config, memo)
+            elapsed = perf_counter_ns() - start
+            if step.clean_method is None:
+                kwargs[field_name] = value
+                recorder.record(model, "convert", field_name, elapsed)
+            else:
+                cleaned.append((field_name, value))
+                recorder.record(model, "clean", field_name, elapsed)
+        kwargs.update(cleaned)
+
+        if self.clean is not None:
+            start = perf_counter_ns()
+            args, clean_kwargs = self.clean_binding.gather(config, view)
+            kwargs.update(self.clean(*args, **clean_kwargs))
+            recorder.record(model, "clean", None, perf_counter_ns() - start)
+
+        start = perf_counter_ns()
+        args, init_kwargs = self.init_binding.gather(config, view)
+        instance = model(*args, **init_kwargs)
+        recorder.record(model, "init", None, perf_counter_ns() - start)
+        return instance
+
+    async def execute_async(self, **kwargs) -> BaseModel:
+        """
+        same as `execute`, but awaits coroutine clean methods.
+        clean_* methods only see the original values, so they run concurrently.
+        `clean` and `__init__` are called once all of them are done.
+        """
+        if not self.is_async:
+            return self.execute(**kwargs)
+
+        config = self.model._config
+        if config.collect_errors:
+            raise self._async_error()
+        view = self._prepare(kwargs)
+        memo = {} if self.has_memo else None
+        cleaned, pending = [], {}
+        for step in self.clean_steps:
+            if (field_name := step.field_name) not in kwargs:
+                continue
+            value = step.run(kwargs[field_name], view, config, memo)
+            if inspect.isawaitable(value):
+                pending[field_name] = value
+            else:
+                cleaned.append((field_name, value))
+        if pending:
+            import asyncio
+
+            results = await asyncio.gather(*pending.values())
+            cleaned.extend(zip(pending, results))
+
+        for step in self.convert_steps:
+            if (field_name := step.field_name) in kwargs:
+                kwargs[field_name] = step.run(kwargs[field_name], view, config, memo)
+        kwargs.update(cleaned)
+
+        if self.clean is not None:
+            args, clean_kwargs = self.clean_binding.gather(config, view)
+            cleaned = self.clean(*args, **clean_kwargs)
+            if inspect.isawaitable(cleaned):
+                cleaned = await cleaned
+            kwargs.update(cleaned)
+        args, init_kwargs = self.init_binding.gather(config, view)
+        return self.model(*args, **init_kwargs)
+
+
+def _memoize_shared_conversions(
+    steps: dict[str, FieldStep], config: Config
+) -> dict[str, FieldStep]:
+    """
+    find the values converted to the same annotation by more than one step,
+    e.g. `birthday` taken by both clean_age and clean_birthday.
+    """
+
+    def keys(step: FieldStep) -> Iterator[tuple[str, Annotation]]:
+        if step.clean_method is None:
+            if not isinstance(step.reference, LazyReference):
+                yield step.field_name, step.reference
+        elif not step.binding.has_var_keyword:
+            for name in step.binding.param_names:
+                yield name, step.binding.annotations[name]
+
+    counts: dict[tuple, int] = {}
+    for step in steps.values():
+        for name, annotation in keys(step):
+            if _is_shareable(annotation, config):
+                key = (name, annotation.analysis)
+                counts[key] = counts.get(key, 0) + 1
+
+    return {
+        field_name: dataclasses.replace(
+            step,
+            memoized=frozenset(
+                name
+                for name, annotation in keys(step)
+                if counts.get((name, annotation.analysis), 0) > 1
+            ),
+        )
+        for field_name, step in steps.items()
+    }
+
+
+def _is_shareable(annotation: Annotation, config: Config) -> bool:
+    if not config._is_convertible(annotation):
+        return False
+    analysis = annotation.analysis
+    while analysis.is_annotated or analysis.is_init_var:
+        analysis = analysis.child(0)
+    origin = analysis.origin
+    if dataclasses.is_dataclass(origin) and not origin.__dataclass_params__.frozen:
+        # nested models, a clean method could modify the one of a field.
+        return False
+    return not analysis.has_args and origin not in MUTABLE_TYPES
+
+
+def _is_coroutine_method(method: Callable) -> bool:
+    func = inspect.unwrap(getattr(method, "__func__", method))
+    if inspect.iscoroutinefunction(func):
+        return True
+
+    # singledispatchmethod: any of the registered implementations.
+    dispatcher = getattr(getattr(method, "register", None), "__self__", None)
+    registry = getattr(getattr(dispatcher, "dispatcher", None), "registry", {})
+    return any(
+        inspect.iscoroutinefunction(getattr(impl, "__func__", impl))
+        for impl in registry.values()
+    )
@@ -0,0 +1,91 @@
+"""
+On-disk cache of construction plans, enabled by the `plan_cache` option.
+
+Processes importing the same models again, such as spawned workers,
+load the plan of a model from `ConstructionPlan.to_spec` instead of
+inspecting the model and the signatures of its methods.
+
+Files are keyed on the module and qualified name of the model
+and a hash of the module source, so editing the module invalidates them.
+Models defined in functions or outside of a source file are not cached.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Type
+
+from fastructure.plan import ConstructionPlan
+
+if TYPE_CHECKING:
+    from fastructure.base import BaseModel
+
+# bumped whenever the spec format changes.
+FORMAT = 1
+
+
+@cache
+def _source_hash(filename: str) -> str:
+    digest = hashlib.blake2b(str(FORMAT).encode(), digest_size=16)
+    with open(filename, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def path(model: Type["BaseModel"]) -> Path | None:
+    """
+    the cache file of `model`, None if the model cannot be cached.
+    """
+    module = sys.modules.get(model.__module__)
+    filename = getattr(module, "__file__", None)
+    if filename is None or "<locals>" in model.__qualname__:
+        return None
+    try:
+        source_hash = _source_hash(filename)
+    except OSError:
+        return None
+    name = f"{model.__module__}.{model.__qualname__}-{source_hash}.json"
+    return Path(model._config.plan_cache) / name
+
+
+def load(model: Type["BaseModel"]) -> ConstructionPlan | None:
+    """
+    the cached plan of `model`, None if missing or stale.
+    """
+    if (file := path(model)) is None:
+        return None
+    try:
+        with open(file) as f:
+            return ConstructionPlan.from_spec(model, json.load(f))
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        return None
+
+
+def store(model: Type["BaseModel"], plan: ConstructionPlan) -> None:
+    """
+    write the plan of `model`. failures are ignored, the cache is an optimization.
+    """
+    if (file := path(model)) is None:
+        return
+    try:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        # written aside and renamed, as other processes may read it meanwhile.
+        temp = file.with_name(f"{file.name}.{os.getpid()}")
+        temp.write_text(json.dumps(plan.to_spec()))
+        os.replace(temp, file)
+    except OSError:
+        pass
+
+
+def compile(model: Type["BaseModel"]) -> ConstructionPlan:
+    """
+    load the plan of `model` from the cache, or compile and store it.
+    """
+    plan = load(model)
+    if plan is None:
+        plan = ConstructionPlan.compile(model)
+        store(model, plan)
+    return plan
@@ -8,9 +8,102 @@ if TYPE_CHECKING:
     from fastructure.base import BaseModel
 
 
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class Analysis:
+    """
+    Everything derived from a typehint, computed once per typehint.
+    Use `analyse` to get the shared record of a typehint.
+    """
+
+    typehint: Any
+    origin: Any
+    args: tuple[Any, ...]
+    children: tuple["Analysis", ...]
+    is_annotated: bool
+    is_init_var: bool
+    has_auto_convert: bool
+    # convertible even if convert_all is False
+    is_auto_convertible: bool
+    is_fastructure_model: bool
+    has_fastructure_model: bool
+
+    @property
+    def has_args(self) -> bool:
+        return len(self.args) > 0
+
+    def child(self, index: int) -> "Analysis":
+        if not self.args:
+            raise ValueError(f"No annotation for {index}, {self.typehint}.")
+
+        # tuple[int, ...]: every value has the type of the first argument.
+        if len(self.children) == 1 or self.args[-1] is Ellipsis:
+            return self.children[0]
+
+        try:
+            return self.children[index]
+        except IndexError:
+            raise ValueError(
+                f"Annotation {self.typehint} has no child at index {index}."
+            )
+
+
+_analyses: dict[Any, Analysis] = {}
+
+
+def analyse(typehint: Any) -> Analysis:
+    try:
+        return _analyses[typehint]
+    except KeyError:
+        analysis = _analyses[typehint] = _analyse(typehint)
+        return analysis
+    except TypeError:
+        # unhashable typehint, e.g. Annotated with a list as metadata
+        return _analyse(typehint)
+
+
+def _analyse(typehint: Any) -> Analysis:
+    from fastructure.base import BaseModel
+
+    is_init_var = isinstance(typehint, dataclasses.InitVar)
+    origin = get_origin(typehint) or typehint
+    args = (typehint.type,) if is_init_var else get_args(typehint)
+    children = tuple(analyse(arg) for arg in args)
+    has_auto_convert = any(
+        child.origin is AutoConvert or child.has_auto_convert for child in children
+    )
+    if is_init_var:
+        # For InitVar fields, check the inner annotation for AutoConvert
+        inner = children[0]
+        is_auto_convertible = inner.origin is Annotated and inner.has_auto_convert
+    else:
+        is_auto_convertible = origin is Annotated and has_auto_convert
+
+    try:
+        is_fastructure_model = issubclass(origin, BaseModel)
+    except TypeError:
+        is_fastructure_model = False
+    has_fastructure_model = is_fastructure_model or any(
+        child.has_fastructure_model for child in children
+    )
+
+    return Analysis(
+        typehint=typehint,
+        origin=origin,
+        args=args,
+        children=children,
+        is_annotated=origin is Annotated,
+        is_init_var=is_init_var,
+        has_auto_convert=has_auto_convert,
+        is_auto_convertible=is_auto_convertible,
+        is_fastructure_model=is_fastructure_model,
+        has_fastructure_model=has_fastructure_model,
+    )
+
+
 class Annotation:
     def __init__(self, typehint: Any):
         self._typehint = typehint
+        self.analysis = analyse(typehint)
 
     def __str__(self):
         return f"{self._typehint}"
@@ -19,50 +112,35 @@ class Annotation:
 
     @property
     def is_annotated(self) -> bool:
-        return get_origin(self._typehint) is Annotated
+        return self.analysis.is_annotated
 
     @property
     def is_init_var(self) -> bool:
-        return isinstance(self._typehint, dataclasses.InitVar)
+        return self.analysis.is_init_var
 
     @property
     def has_auto_convert(self) -> bool:
-        return any(
-            anno.origin is AutoConvert or anno.has_auto_convert
-            for anno in self.children
-        )
+        return self.analysis.has_auto_convert
 
     @property
     def has_args(self) -> bool:
-        return len(self.args) > 0
+        return self.analysis.has_args
 
-    @cached_property
+    @property
     def has_fastructure_model(self) -> bool:
-        if self.is_fastructure_model:
-            return True
-
-        return any(ref.has_fastructure_model for ref in self.children)
+        return self.analysis.has_fastructure_model
 
-    @cached_property
+    @property
     def is_fastructure_model(self) -> bool:
-        from fastructure.base import BaseModel
-
-        try:
-            return issubclass(self.origin, BaseModel)
-        except TypeError:
-            return False
+        return self.analysis.is_fastructure_model
 
-    @cached_property
+    @property
     def origin(self):
-        if origin := get_origin(self._typehint):
-            return origin
-        return self._typehint
+        return self.analysis.origin
 
-    @cached_property
+    @property
     def args(self) -> list[Any]:
-        if self.is_init_var:
-            return [self._typehint.type]
-        return list(get_args(self._typehint))
+        return list(self.analysis.args)
 
     @cached_property
     def children(self) -> list[Self]:
@@ -70,14 +148,14 @@ class Annotation:
             Annotation(
                 typehint=typehint,
             )
-            for typehint in self.args
+            for typehint in self.analysis.args
         ]
 
     def get_child_annotation(self, index: int):
         if not self.has_args:
             raise ValueError(f"No annotation for {index}, {self._typehint}.")
 
-        if len(self.children) == 1:
+        if len(self.children) == 1 or self.args[-1] is Ellipsis:
             return self.children[0]
 
         try:
@@ -127,3 +205,32 @@ class Reference(Annotation):
         return f"{self.__class__.__name__}({self.path})[{super().__str__()}]"
 
     __repr__ = __str__
+
+
+class SlotReference(Reference):
+    """
+    Reference of a field of a slotted model.
+    It takes the place of the slot on the class, so access on an instance
+    is delegated to the slot descriptor of the dataclass.
+    """
+
+    def __init__(
+        self,
+        cls: Type["BaseModel"],
+        cls_var_name: str,
+        typehint: Any,
+        slot: Any,
+    ):
+        self._slot = slot
+        super().__init__(cls, cls_var_name, typehint)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self._slot.__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        self._slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self._slot.__delete__(instance)
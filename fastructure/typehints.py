@@ -4,3 +4,11 @@ class AutoConvert:
     ex.
     def clean_value(self, value: Annotated[int, AutoConvert]):
     """
+
+
+class Lazy:
+    """
+    Build nested models of a field on first attribute access.
+    ex.
+    authors: Annotated[list[Author], Lazy]
+    """
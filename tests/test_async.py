@@ -0,0 +1,110 @@
+import asyncio
+import dataclasses
+from functools import singledispatchmethod
+from unittest import TestCase
+
+from fastructure import structured
+from fastructure.exceptions import RowError
+
+# appended to by the clean methods of User, to check the order they run in.
+EVENTS: list[str] = []
+
+
+@structured()
+@dataclasses.dataclass(frozen=True)
+class User:
+    name: str
+    country: str
+    age: int
+
+    @classmethod
+    async def clean_name(cls, name: str) -> str:
+        await asyncio.sleep(0)
+        EVENTS.append("name")
+        return name.strip()
+
+    @classmethod
+    async def clean_country(cls, country: str) -> str:
+        EVENTS.append("country")
+        await asyncio.sleep(0)
+        if country not in ("JP", "US"):
+            raise cls.ValidationError(f"unknown country {country}")
+        return country
+
+    @classmethod
+    async def clean(cls, **kwargs) -> dict:
+        EVENTS.append("clean")
+        return kwargs | {"age": int(kwargs["age"])}
+
+
+@structured()
+@dataclasses.dataclass(frozen=True)
+class Plain:
+    name: str
+
+    @classmethod
+    def clean_name(cls, name: str) -> str:
+        return name.strip()
+
+
+class TestAsync(TestCase):
+    def setUp(self):
+        EVENTS.clear()
+
+    def test_aconstruct(self):
+        self.assertTrue(User._plan.is_async)
+        user = asyncio.run(User.aconstruct(name=" John ", country="JP", age="20"))
+        self.assertEqual(User("John", "JP", 20), user)
+        # country starts while name is waiting, clean runs after both.
+        self.assertListEqual(["country", "name", "clean"], EVENTS)
+
+        with self.assertRaises(TypeError):
+            User.construct(name="John", country="JP", age=20)
+
+    def test_afrom_dict(self):
+        user = asyncio.run(User.afrom_dict({"name": "John", "country": "US", "age": 1}))
+        self.assertEqual(User("John", "US", 1), user)
+
+        with self.assertRaises(User.ValidationError):
+            asyncio.run(User.afrom_dict({"name": "John", "country": "US"}))
+
+    def test_afrom_dicts(self):
+        rows = [{"name": str(i), "country": "JP", "age": i} for i in range(10)]
+        rows[3]["country"] = "XX"
+        with self.assertRaises(User.ValidationError):
+            asyncio.run(User.afrom_dicts(rows))
+
+        errors: list[RowError] = []
+        users = asyncio.run(User.afrom_dicts(rows, errors=errors, concurrency=4))
+        self.assertListEqual(
+            [str(i) for i in range(10) if i != 3], [user.name for user in users]
+        )
+        self.assertListEqual([3], [error.index for error in errors])
+
+    def test_sync_model(self):
+        self.assertFalse(Plain._plan.is_async)
+        self.assertEqual(Plain("a"), asyncio.run(Plain.aconstruct(name=" a ")))
+        self.assertEqual(Plain("a"), asyncio.run(Plain.afrom_dict({"name": " a "})))
+        self.assertListEqual(
+            [Plain("a")], asyncio.run(Plain.afrom_dicts([{"name": " a "}]))
+        )
+
+    def test_single_dispatch(self):
+        @structured()
+        @dataclasses.dataclass(frozen=True)
+        class Score:
+            value: int
+
+            @singledispatchmethod
+            @classmethod
+            def clean_value(cls, value) -> int:
+                return value
+
+            @clean_value.register
+            @classmethod
+            async def _(cls, value: str) -> int:
+                return int(value)
+
+        self.assertTrue(Score._plan.is_async)
+        self.assertEqual(Score(1), asyncio.run(Score.aconstruct(value="1")))
+        self.assertEqual(Score(2), asyncio.run(Score.aconstruct(value=2)))
@@ -0,0 +1,32 @@
+import io
+import json
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import TestCase, mock
+
+from fastructure.bench import SCENARIOS, scenario
+from fastructure.bench.__main__ import main
+
+
+class TestBench(TestCase):
+    def test_every_scenario_runs(self):
+        with redirect_stdout(io.StringIO()) as stdout:
+            main(["--number", "1", "--repeat", "1"])
+
+        results = json.loads(stdout.getvalue())["results"]
+        self.assertListEqual(list(SCENARIOS), [result["name"] for result in results])
+        for result in results:
+            self.assertGreater(result["ops_per_sec"], 0)
+            self.assertGreaterEqual(result["peak_bytes_per_call"], 0)
+
+    def test_unknown_scenario(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["unknown"])
+
+    def test_errors_of_scenarios_are_raised(self):
+        def setup():
+            return lambda: {}["missing"]
+
+        with mock.patch.dict(SCENARIOS):
+            scenario("key_error")(setup)
+            with self.assertRaises(KeyError):
+                main(["key_error", "--number", "1", "--repeat", "1"])
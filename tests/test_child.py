@@ -114,6 +114,18 @@ class TestChild(TestCase):
             book.authors,
         )
 
+    def test_variadic_tuple(self):
+        for collect_errors in (False, True):
+
+            @structured(convert_all=True, collect_errors=collect_errors)
+            @dataclasses.dataclass(frozen=True)
+            class Book:
+                title: str
+                pages: tuple[int, ...]
+
+            book = Book.from_dict({"title": "Book", "pages": ("1", "2", "3")})
+            self.assertTupleEqual((1, 2, 3), book.pages)
+
     def test_grand_child_list(self):
         @structured(convert_all=True)
         @dataclasses.dataclass(frozen=True)
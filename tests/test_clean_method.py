@@ -63,3 +63,19 @@ class TestCleanMethod(TestCase):
             birthday=datetime(1990, 1, 1),
         )
         self.assertEqual(datetime(1990, 1, 1), author.birthday)
+
+    def test_static_clean(self):
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Book:
+            title: str
+            pages: int
+
+            @staticmethod
+            def clean(**kwargs) -> dict:
+                return kwargs | {"title": kwargs["title"].title()}
+
+        self.assertEqual(
+            Book("Fluent Python", 790),
+            Book.from_dict({"title": "fluent python", "pages": "790"}),
+        )
@@ -0,0 +1,134 @@
+import dataclasses
+from datetime import datetime
+from typing import Annotated
+from unittest import TestCase
+
+from fastructure import structured
+from fastructure.exceptions import ConvertError
+from fastructure.typehints import AutoConvert
+
+
+def define(**kwargs):
+    @structured(**kwargs)
+    @dataclasses.dataclass(frozen=True)
+    class Location:
+        name: str
+
+    @structured(**kwargs)
+    @dataclasses.dataclass(frozen=True)
+    class Author:
+        name: str
+        age: int
+        birthday: datetime
+        locations: list[Location]
+
+        @classmethod
+        def dict_map(cls) -> dict:
+            return {
+                "key-name": cls.name,
+                "key-age": cls.age,
+                "key-birthday": cls.birthday,
+                "key-locations": cls.locations,
+                "ignored": "ignored",
+            }
+
+    return Author
+
+
+class TestCodegen(TestCase):
+    def test_same_result_as_generic_path(self):
+        generic = define(convert_all=True)
+        compiled = define(convert_all=True, compile=True)
+        data = {
+            "key-name": "John",
+            "key-age": "20",
+            "key-birthday": "2000-01-01",
+            "key-locations": [{"name": "Japan"}],
+            "ignored": None,
+        }
+        self.assertEqual(
+            dataclasses.asdict(generic.from_dict(data)),
+            dataclasses.asdict(compiled.from_dict(data)),
+        )
+        self.assertEqual(
+            "define.<locals>.Author.from_dict", compiled.from_dict.__qualname__
+        )
+        self.assertEqual(
+            dataclasses.asdict(generic.from_list(["John", "20", "2000-01-01", []])),
+            dataclasses.asdict(compiled.from_list(["John", "20", "2000-01-01", []])),
+        )
+        self.assertEqual(2, len(compiled.from_dicts([data, data])))
+
+        for broken in (
+            {k: v for k, v in data.items() if k != "key-birthday"},
+            data | {"key-age": "twenty"},
+        ):
+            with self.assertRaises(Exception) as generic_error:
+                generic.from_dict(broken)
+            with self.assertRaises(Exception) as compiled_error:
+                compiled.from_dict(broken)
+            generic_exception, compiled_exception = (
+                generic_error.exception,
+                compiled_error.exception,
+            )
+            self.assertIs(type(generic_exception), type(compiled_exception))
+            self.assertEqual(str(generic_exception), str(compiled_exception))
+
+        with self.assertRaises(compiled.ValidationError) as e:
+            compiled.from_list(["John"])
+        self.assertEqual(
+            "class 'Author' must have a list map with length 1", str(e.exception)
+        )
+
+    def test_auto_convert(self):
+        @structured(compile=True)
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            name: str
+            age: Annotated[int, AutoConvert]
+
+        self.assertEqual(Author(1, 20), Author.from_list([1, "20"]))
+        with self.assertRaises(ConvertError):
+            Author.from_dict({"name": "John", "age": "twenty"})
+
+    def test_data_as_keyword(self):
+        @structured(convert_all=True, compile=True)
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            name: str
+            age: int
+
+        # the first call compiles the loaders, the second one runs them.
+        for _ in range(2):
+            self.assertEqual(
+                Author("John", 20), Author.from_dict(data={"name": "John", "age": "20"})
+            )
+            self.assertEqual(Author("John", 20), Author.from_list(data=["John", "20"]))
+        self.assertIn("from_dict", Author.__dict__)
+
+    def test_static_clean_falls_back(self):
+        @structured(convert_all=True, compile=True)
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            name: str
+
+            @staticmethod
+            def clean(name: str) -> dict:
+                return {"name": name.strip()}
+
+        self.assertEqual(Author("John"), Author.from_dict({"name": " John "}))
+        self.assertNotIn("from_dict", Author.__dict__)
+
+    def test_fallback(self):
+        @structured(convert_all=True, compile=True)
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            name: str
+
+            @classmethod
+            def clean_name(cls, name: str) -> str:
+                return name.strip()
+
+        self.assertEqual(Author("John"), Author.from_dict({"name": " John "}))
+        self.assertNotIn("from_dict", Author.__dict__)
+        self.assertEqual(Author("John"), Author.from_list([" John "]))
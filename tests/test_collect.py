@@ -0,0 +1,133 @@
+import asyncio
+import dataclasses
+import pickle
+from datetime import datetime
+from unittest import TestCase
+
+from fastructure import structured
+from fastructure.exceptions import FieldError, RowError, ValidationErrors
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Author:
+    name: str
+    birthday: datetime
+
+    @classmethod
+    def clean_name(cls, name: str) -> str:
+        if not name:
+            raise ValueError("name must not be empty")
+        return name
+
+
+@structured(convert_all=True, collect_errors=True)
+@dataclasses.dataclass(frozen=True)
+class Book:
+    title: str
+    pages: int
+    authors: list[Author]
+
+    @classmethod
+    def dict_map(cls) -> dict:
+        return {"book-title": cls.title, "pages": cls.pages, "authors": cls.authors}
+
+
+class TestCollectErrors(TestCase):
+    def test_valid(self):
+        book = Book.from_dict(
+            {
+                "book-title": "Book",
+                "pages": "100",
+                "authors": [{"name": "John", "birthday": "2000-01-01"}],
+            }
+        )
+        self.assertEqual(
+            Book("Book", 100, [Author("John", datetime(2000, 1, 1))]), book
+        )
+
+    def test_every_error_is_collected(self):
+        with self.assertRaises(ValidationErrors) as e:
+            Book.from_dict(
+                {
+                    "pages": "many",
+                    "authors": [
+                        {"name": "John", "birthday": "2000-01-01"},
+                        {"name": "", "birthday": "2000-01-01"},
+                        {"name": "Jane"},
+                        {"name": "Jack", "birthday": "yesterday"},
+                    ],
+                }
+            )
+
+        errors = e.exception.errors
+        self.assertTrue(all(isinstance(error, FieldError) for error in errors))
+        self.assertListEqual(
+            [
+                "Book.title",
+                "Book.pages",
+                "Book.authors[1].name",
+                "Book.authors[2].birthday",
+                "Book.authors[3].birthday",
+            ],
+            [error.path for error in errors],
+        )
+        self.assertEqual(
+            "book-title is required to make a instance of 'Book'",
+            str(errors[0].error),
+        )
+        self.assertEqual(
+            ["name must not be empty"], e.exception.to_dict()["Book.authors[1].name"]
+        )
+        restored = pickle.loads(pickle.dumps(e.exception))
+        self.assertEqual(e.exception.to_dict(), restored.to_dict())
+
+    def test_from_list_and_construct(self):
+        with self.assertRaises(ValidationErrors) as e:
+            Book.from_list(["Book"])
+        self.assertListEqual(
+            ["Book.pages", "Book.authors"], [error.path for error in e.exception.errors]
+        )
+
+        with self.assertRaises(ValidationErrors) as e:
+            Book.construct(title="Book", pages="x", authors=None)
+        self.assertListEqual(
+            ["Book.pages", "Book.authors"], [error.path for error in e.exception.errors]
+        )
+
+    def test_from_dicts(self):
+        rows = [
+            {"book-title": "A", "pages": 1, "authors": []},
+            {"book-title": "B", "pages": "x", "authors": [{"name": ""}]},
+        ]
+        errors: list[RowError] = []
+        self.assertEqual([Book("A", 1, [])], Book.from_dicts(rows, errors=errors))
+        self.assertEqual(1, errors[0].index)
+        self.assertEqual(3, len(errors[0].error.errors))
+
+    def test_async_clean_methods(self):
+        @structured(collect_errors=True)
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            name: str
+
+            @classmethod
+            async def clean_name(cls, name: str) -> str:
+                return name
+
+        with self.assertRaises(TypeError):
+            Author.from_dict({"name": "John"})
+        with self.assertRaises(TypeError):
+            asyncio.run(Author.afrom_dict({"name": "John"}))
+        with self.assertRaises(TypeError):
+            asyncio.run(Author.aconstruct(name="John"))
+
+    def test_async_loaders_collect(self):
+        data = {"pages": "many", "authors": []}
+        with self.assertRaises(ValidationErrors) as e:
+            asyncio.run(Book.afrom_dict(data))
+        self.assertEqual(2, len(e.exception.errors))
+
+        with self.assertRaises(ValidationErrors) as e:
+            asyncio.run(Book.aconstruct(title="Book", pages="x", authors=None))
+        self.assertEqual(2, len(e.exception.errors))
@@ -0,0 +1,88 @@
+import dataclasses
+from datetime import datetime
+from typing import Annotated
+from unittest import TestCase, skipUnless
+
+from fastructure import structured
+from fastructure.typehints import AutoConvert
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Author:
+    name: str
+    age: int
+    score: float
+    birthday: datetime
+    tags: list[str]
+
+    @classmethod
+    def list_map(cls) -> list:
+        return [cls.name, cls.age, cls.score, cls.birthday, cls.tags]
+
+
+@skipUnless(np, "numpy is not installed")
+class TestModelArray(TestCase):
+    def test_collection(self):
+        authors = Author.collection(
+            [
+                {
+                    "name": "John",
+                    "age": "20",
+                    "score": 1.5,
+                    "birthday": "2000-01-01",
+                    "tags": ["a"],
+                },
+                {
+                    "name": "Jane",
+                    "age": 30,
+                    "score": "2.5",
+                    "birthday": "1990-01-01",
+                    "tags": [],
+                },
+            ]
+        )
+        self.assertEqual(2, len(authors))
+        self.assertEqual(np.int64, authors.age.dtype)
+        self.assertEqual(25, authors.age.mean())
+        self.assertIs(authors.age, authors.columns["age"])
+        self.assertEqual(np.dtype("datetime64[us]"), authors.birthday.dtype)
+        self.assertEqual(object, authors.name.dtype)
+
+        self.assertEqual(
+            Author("John", 20, 1.5, datetime(2000, 1, 1), ["a"]), authors[0]
+        )
+        self.assertIsInstance(authors[0].age, int)
+        self.assertListEqual(
+            [Author("Jane", 30, 2.5, datetime(1990, 1, 1), [])], list(authors[1:])
+        )
+        self.assertTrue(np.shares_memory(authors.age, authors[1:].age))
+
+        with self.assertRaises(Author.ValidationError):
+            Author.collection([{"name": "John"}])
+
+    def test_from_lists(self):
+        authors = Author.collection(
+            [["John", "20", "1.5", "2000-01-01", ("a", "b")]], kind="list"
+        )
+        self.assertEqual(
+            Author("John", 20, 1.5, datetime(2000, 1, 1), ["a", "b"]), authors[0]
+        )
+
+    def test_unsupported_model(self):
+        @structured()
+        @dataclasses.dataclass(frozen=True)
+        class Cleaned:
+            age: Annotated[int, AutoConvert]
+
+            @classmethod
+            def clean_age(cls, age: int) -> int:
+                return age
+
+        with self.assertRaises(TypeError):
+            Cleaned.collection([{"age": 1}])
@@ -0,0 +1,65 @@
+import dataclasses
+from datetime import datetime
+from unittest import TestCase
+
+from fastructure import Converter, structured
+from fastructure.exceptions import ConvertError
+
+
+class CountingConverter(Converter):
+    calls = 0
+
+
+@CountingConverter.register(str, datetime)
+def _(value: str) -> datetime:
+    CountingConverter.calls += 1
+    return datetime.fromisoformat(value)
+
+
+@structured(converter=CountingConverter, convert_all=True, conversion_cache=2)
+@dataclasses.dataclass(frozen=True)
+class Event:
+    name: str
+    count: int
+    at: datetime
+    tags: list[str]
+
+
+class TestConversionCache(TestCase):
+    def setUp(self):
+        CountingConverter.calls = 0
+        Event._config.clear_conversion_cache()
+
+    def test_cache(self):
+        rows = [
+            {"name": "a", "count": "1", "at": "2000-01-01", "tags": ["x"]},
+            {"name": "b", "count": 1, "at": "2000-01-01", "tags": ["x"]},
+            {"name": "a", "count": "1", "at": "2000-01-02", "tags": ["x"]},
+        ]
+        events = Event.from_dicts(rows)
+        self.assertEqual(Event("a", 1, datetime(2000, 1, 1), ["x"]), events[0])
+        self.assertEqual(Event("b", 1, datetime(2000, 1, 1), ["x"]), events[1])
+        self.assertEqual(2, CountingConverter.calls)
+
+        info = Event.conversion_cache_info()
+        self.assertEqual((1, 2, 2, 2), tuple(info[datetime]))
+        # values of the target type already are not cached.
+        self.assertEqual((1, 1), (info[int].hits, info[int].misses))
+        self.assertNotIn(list, info)
+        # lists are never shared between instances.
+        self.assertIsNot(events[0].tags, events[2].tags)
+
+    def test_errors_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(ConvertError):
+                Event.construct(name="a", count="one", at="2000-01-01", tags=[])
+        self.assertEqual(0, Event.conversion_cache_info()[int].hits)
+
+    def test_disabled(self):
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Plain:
+            count: int
+
+        self.assertEqual(Plain(1), Plain.from_dict({"count": "1"}))
+        self.assertDictEqual({}, Plain.conversion_cache_info())
@@ -0,0 +1,197 @@
+import dataclasses
+from datetime import datetime
+from decimal import Decimal
+from functools import singledispatchmethod
+from unittest import TestCase, mock
+
+from fastructure import Converter, structured
+from fastructure.exceptions import ConvertError
+
+
+class TestConverter(TestCase):
+    def test_convert(self):
+        self.assertEqual(
+            "2000-01-01T00:00:00", Converter.convert(datetime(2000, 1, 1), str)
+        )
+        self.assertEqual("yes", Converter.convert(True, str))
+        self.assertEqual("", Converter.convert(None, str))
+        self.assertEqual(20, Converter.convert("20", int))
+        self.assertEqual(1, Converter.convert(True, int))
+        self.assertTrue(Converter.convert("YES", bool))
+        self.assertEqual(
+            datetime(2000, 1, 1), Converter.convert("2000-01-01", datetime)
+        )
+        self.assertEqual((1, 2), Converter.convert([1, 2], tuple))
+        self.assertEqual({1, 2}, Converter.convert({1, 2}, set))
+
+        with self.assertRaises(ConvertError):
+            Converter.convert("twenty", int)
+
+        with mock.patch.object(Converter, "__init__") as init:
+            Converter.convert("20", int)
+        init.assert_not_called()
+
+        self.assertEqual(20, Converter("20", int).execute())
+
+    def test_register(self):
+        class MyConverter(Converter):
+            pass
+
+        @MyConverter.register(str, Decimal)
+        def _(value: str) -> Decimal:
+            return Decimal(value.replace(",", ""))
+
+        @MyConverter.register(str, int)
+        def _(value: str) -> int:
+            return int(value.replace(",", ""))
+
+        self.assertEqual(Decimal("1000.5"), MyConverter.convert("1,000.5", Decimal))
+        self.assertEqual(1000, MyConverter.convert("1,000", int))
+        self.assertEqual(1, MyConverter.convert(1.5, int))
+        self.assertEqual("1,000", Converter.convert("1,000", Decimal))
+
+        @structured(converter=MyConverter, convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Item:
+            price: Decimal
+            quantity: int
+
+        self.assertEqual(
+            Item(Decimal("1200"), 1000),
+            Item.from_dict({"price": "1,200", "quantity": "1,000"}),
+        )
+
+    def test_overridden_methods(self):
+        class MyConverter(Converter):
+            @singledispatchmethod
+            def to_str(self, value) -> str:
+                return str(value)
+
+            @to_str.register
+            def _(self, value: bool) -> str:
+                return "true" if value else "false"
+
+        class ExecuteConverter(Converter):
+            def _execute(self):
+                return f"{self._to_type.__name__}:{self._value}"
+
+        self.assertEqual("true", MyConverter.convert(True, str))
+        self.assertEqual(2, MyConverter.convert("2", int))
+        self.assertEqual("int:2", ExecuteConverter.convert("2", int))
+
+
+class TestExecuteMany(TestCase):
+    def test_execute_many(self):
+        values = ["1", 2, 3.5, True, "1_000"] * 100
+        for to_type in (int, float, str, bool):
+            self.assertListEqual(
+                [Converter.convert(value, to_type) for value in values],
+                Converter.execute_many(values, to_type),
+            )
+        self.assertListEqual(
+            [datetime(2000, 1, 1), datetime.fromtimestamp(0)],
+            Converter.execute_many(iter(["2000-01-01", 0]), datetime),
+        )
+
+        for size in (10, 1000):
+            values = ["1"] * size
+            values[size - 3] = "one"
+            with self.assertRaises(ConvertError) as e:
+                Converter.execute_many(values, int)
+            self.assertEqual(size - 3, e.exception.index)
+            self.assertEqual(
+                "invalid literal for int() with base 10: 'one'", str(e.exception)
+            )
+
+    def test_registered_conversion_wins(self):
+        class MyConverter(Converter):
+            pass
+
+        @MyConverter.register(str, int)
+        def _(value: str) -> int:
+            return int(value.replace(",", ""))
+
+        self.assertListEqual(
+            [1000] * 300, MyConverter.execute_many(["1,000"] * 300, int)
+        )
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Author:
+    name: str
+    age: int
+    birthday: datetime
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Book:
+    title: str
+    position: tuple[int, str]
+    authors: list[Author]
+    editor: Author
+
+
+class TestPassThrough(TestCase):
+    def test_passes_through(self):
+        for to_type in (str, int, float, bool, datetime, tuple, Author):
+            self.assertTrue(Converter.passes_through(to_type), to_type)
+        self.assertFalse(Converter.passes_through(list))
+
+        class StripConverter(Converter):
+            pass
+
+        @StripConverter.register(str, str)
+        def _(value: str) -> str:
+            return value.strip()
+
+        class IntConverter(Converter):
+            def to_int(self, value) -> int:
+                return int(value) + 1
+
+        self.assertFalse(StripConverter.passes_through(str))
+        self.assertTrue(StripConverter.passes_through(int))
+        self.assertFalse(IntConverter.passes_through(int))
+
+    def test_typed_values_are_kept(self):
+        author = Author("John", 20, datetime(2000, 1, 1))
+        position = (1, "shelf")
+        data = {
+            "title": "Python",
+            "position": position,
+            "authors": [author],
+            "editor": author,
+        }
+        Book.from_dict(data)
+
+        with mock.patch.object(
+            Converter, "_resolve", wraps=Converter._resolve
+        ) as resolve:
+            book = Book.from_dict(data)
+        # only the list of authors is converted, to copy it.
+        self.assertSetEqual(
+            {(list, list)}, {args for args, _ in resolve.call_args_list}
+        )
+        self.assertIs(position, book.position)
+        self.assertIs(author, book.editor)
+        self.assertIs(author, book.authors[0])
+        # mutable containers are still copied.
+        self.assertIsNot(data["authors"], book.authors)
+
+        book = Book.from_dict(data | {"position": ("1", "shelf")})
+        self.assertEqual(position, book.position)
+        self.assertIsNot(position, book.position)
+
+    def test_compiled(self):
+        @structured(convert_all=True, compile=True)
+        @dataclasses.dataclass(frozen=True)
+        class Event:
+            name: str
+            at: datetime
+
+        at = datetime(2000, 1, 1)
+        self.assertIs(at, Event.from_dict({"name": "launch", "at": at}).at)
+        self.assertEqual(
+            Event("launch", at), Event.from_list(["launch", "2000-01-01T00:00:00"])
+        )
@@ -0,0 +1,58 @@
+import dataclasses
+from datetime import datetime
+from unittest import TestCase
+
+from fastructure import structured
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Author:
+    name: str
+    age: int
+    birthday: datetime
+
+    @classmethod
+    def dict_map(cls) -> dict:
+        return {"author-name": cls.name, "age": "age", "birthday": cls.birthday}
+
+    @classmethod
+    def list_map(cls) -> list:
+        return [cls.birthday, cls.name, cls.age]
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Book:
+    title: str
+    authors: list[Author]
+    tags: tuple[str, ...]
+
+    @classmethod
+    def list_map(cls) -> dict:
+        return {0: "isbn", 1: cls.title, 2: cls.authors, 3: cls.tags}
+
+
+class TestDumper(TestCase):
+    def test_to_dict(self):
+        data = {
+            "title": "Book",
+            "authors": [
+                {"author-name": "John", "age": 20, "birthday": "2000-01-01T00:00:00"}
+            ],
+            "tags": ("a", "b"),
+        }
+        book = Book.from_dict(data)
+        self.assertDictEqual(data, book.to_dict())
+        self.assertEqual(book, Book.from_dict(book.to_dict()))
+
+    def test_to_list(self):
+        author = Author("John", 20, datetime(2000, 1, 1))
+        self.assertListEqual(["2000-01-01T00:00:00", "John", 20], author.to_list())
+        self.assertEqual(author, Author.from_list(author.to_list()))
+
+        book = Book("Book", [author], ("a",))
+        self.assertListEqual(
+            [None, "Book", [["2000-01-01T00:00:00", "John", 20]], ("a",)],
+            book.to_list(),
+        )
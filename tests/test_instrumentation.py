@@ -0,0 +1,69 @@
+import dataclasses
+import json
+from datetime import datetime
+from unittest import TestCase
+
+import fastructure
+from fastructure import instrumentation, structured
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Author:
+    name: str
+    birthday: datetime
+
+    @classmethod
+    def clean_name(cls, name: str) -> str:
+        return name.strip()
+
+    @classmethod
+    def clean(cls, **kwargs) -> dict:
+        return kwargs
+
+
+class TestInstrumentation(TestCase):
+    def test_disabled(self):
+        self.assertIsNone(instrumentation.recorder)
+        Author.from_dict({"name": "John", "birthday": "2000-01-01"})
+        self.assertDictEqual({}, fastructure.stats().to_dict())
+
+    def test_recording(self):
+        with instrumentation.recording() as recorder:
+            for _ in range(3):
+                Author.from_dict({"name": "John", "birthday": "2000-01-01"})
+            Author.from_list(["John", "2000-01-01"])
+            stats = fastructure.stats()
+        self.assertIsNone(instrumentation.recorder)
+
+        result = stats.to_dict()[f"{__name__}.Author"]
+        self.assertSetEqual({"map", "clean", "convert", "init"}, set(result))
+        self.assertEqual(4, result["map"]["*"]["calls"])
+        self.assertEqual(4, result["clean"]["name"]["calls"])
+        self.assertEqual(4, result["clean"]["*"]["calls"])
+        self.assertEqual(4, result["convert"]["birthday"]["calls"])
+        self.assertEqual(4, result["init"]["*"]["calls"])
+        self.assertGreater(result["init"]["*"]["total_seconds"], 0)
+        self.assertDictEqual(stats.to_dict(), json.loads(stats.to_json()))
+
+        recorder.reset()
+        self.assertDictEqual({}, recorder.snapshot().to_dict())
+
+    def test_custom_recorder(self):
+        records = []
+
+        class ListRecorder(instrumentation.Recorder):
+            def record(self, model, phase, field, elapsed_ns):
+                records.append((model, phase, field))
+
+        with instrumentation.recording(ListRecorder()):
+            Author.construct(name="John", birthday="2000-01-01")
+        self.assertListEqual(
+            [
+                (Author, "clean", "name"),
+                (Author, "convert", "birthday"),
+                (Author, "clean", None),
+                (Author, "init", None),
+            ],
+            records,
+        )
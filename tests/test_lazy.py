@@ -0,0 +1,100 @@
+import dataclasses
+import pickle
+from datetime import datetime
+from typing import Annotated
+from unittest import TestCase
+
+from fastructure import structured
+from fastructure.lazy import LazyReference, LazyValue
+from fastructure.typehints import AutoConvert
+from fastructure.typehints import Lazy as LazyHint
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Author:
+    name: str
+    birthday: datetime
+
+
+@structured(convert_all=True, lazy=True)
+@dataclasses.dataclass(frozen=True)
+class Book:
+    title: str
+    authors: list[Author]
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Library:
+    name: str
+    books: list[Book]
+
+
+AUTHOR = {"name": "John", "birthday": "2000-01-01"}
+
+
+class TestLazy(TestCase):
+    def test_lazy_model(self):
+        self.assertIsInstance(Book.authors, LazyReference)
+        self.assertNotIsInstance(Book.title, LazyReference)
+
+        book = Book.from_dict({"title": "Book", "authors": [AUTHOR] * 3})
+        self.assertIsInstance(book.__dict__["authors"], LazyValue)
+        self.assertEqual("Book", book.title)
+        self.assertIsInstance(book.__dict__["authors"], LazyValue)
+
+        authors = book.authors
+        self.assertListEqual([Author("John", datetime(2000, 1, 1))] * 3, authors)
+        self.assertIs(authors, book.authors)
+        self.assertIs(authors, book.__dict__["authors"])
+
+    def test_invalid_data_raises_on_access(self):
+        book = Book.from_dict({"title": "Book", "authors": [{"name": "John"}]})
+        self.assertEqual("Book", book.title)
+        with self.assertRaises(Author.ValidationError):
+            book.authors
+
+        library = Library.from_dict(
+            {"name": "Library", "books": [{"title": "Book", "authors": [{}]}]}
+        )
+        with self.assertRaises(Author.ValidationError):
+            library.validate()
+
+        library = Library.from_dict(
+            {"name": "Library", "books": [{"title": "Book", "authors": [AUTHOR]}]}
+        )
+        self.assertIs(library, library.validate())
+        self.assertNotIsInstance(library.books[0].__dict__["authors"], LazyValue)
+
+    def test_lazy_field(self):
+        @structured()
+        @dataclasses.dataclass(frozen=True)
+        class Shelf:
+            authors: Annotated[list[Author], AutoConvert, LazyHint]
+            main_author: Annotated[Author, AutoConvert]
+
+        shelf = Shelf.from_dict({"authors": [AUTHOR], "main_author": AUTHOR})
+        self.assertIsInstance(shelf.__dict__["authors"], LazyValue)
+        self.assertIsInstance(shelf.__dict__["main_author"], Author)
+        self.assertEqual(shelf.main_author, shelf.authors[0])
+
+    def test_static_clean_is_not_lazy(self):
+        @structured(convert_all=True, lazy=True)
+        @dataclasses.dataclass(frozen=True)
+        class Shelf:
+            authors: list[Author]
+
+            @staticmethod
+            def clean(authors: list[Author]) -> dict:
+                return {"authors": authors[:1]}
+
+        self.assertNotIsInstance(Shelf.authors, LazyReference)
+        shelf = Shelf.from_dict({"authors": [AUTHOR, AUTHOR]})
+        self.assertEqual([Author("John", datetime(2000, 1, 1))], shelf.authors)
+
+    def test_pickle(self):
+        book = Book.from_dict({"title": "Book", "authors": [AUTHOR]})
+        loaded = pickle.loads(pickle.dumps(book))
+        self.assertListEqual([Author("John", datetime(2000, 1, 1))], loaded.authors)
+        self.assertEqual(book, loaded)
@@ -0,0 +1,135 @@
+import dataclasses
+import io
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime
+from unittest import TestCase
+
+from fastructure import structured
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Author:
+    name: str
+    age: int
+    birthday: datetime
+
+    @classmethod
+    def dict_map(cls) -> dict:
+        return {"Name": cls.name, "Age": cls.age, "Birthday": cls.birthday}
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Trade:
+    symbol: str
+    price: float
+    quantity: int
+    executed_at: datetime
+
+    @classmethod
+    def buffer_map(cls) -> list[str]:
+        return ["8s", "d", "q", "d"]
+
+    @classmethod
+    def clean_quantity(cls, quantity: int) -> int:
+        if quantity <= 0:
+            raise ValueError("quantity must be positive")
+        return quantity
+
+
+RECORD = struct.Struct("<8sdqd")
+EXECUTED_AT = datetime(2024, 1, 1, 9, 30)
+
+
+def _record(symbol: bytes, price: float, quantity: int) -> bytes:
+    return RECORD.pack(symbol, price, quantity, EXECUTED_AT.timestamp())
+
+
+class TestLoaders(TestCase):
+    def test_iter_jsonl(self):
+        source = io.StringIO(
+            '{"Name": "John", "Age": "20", "Birthday": "2000-01-01"}\n'
+            "\n"
+            '{"Name": "Jessy", "Age": 22}\n'
+            "not json\n"
+            '{"Name": "Jane", "Age": 30, "Birthday": "1990-01-01"}\n'
+        )
+        errors = []
+        authors = Author.iter_jsonl(source, errors=errors)
+        self.assertEqual(Author("John", 20, datetime(2000, 1, 1)), next(authors))
+        self.assertListEqual([Author("Jane", 30, datetime(1990, 1, 1))], list(authors))
+        # line numbers, blank lines included.
+        self.assertListEqual([2, 3], [error.index for error in errors])
+
+    def test_iter_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "authors.csv")
+            with open(path, "w", newline="") as f:
+                f.write("Name,Age,Birthday\nJohn,20,2000-01-01\nJane,30,1990-01-01\n")
+
+            self.assertListEqual(
+                [
+                    Author("John", 20, datetime(2000, 1, 1)),
+                    Author("Jane", 30, datetime(1990, 1, 1)),
+                ],
+                list(Author.iter_csv(path)),
+            )
+
+        authors = Author.iter_csv(
+            io.StringIO("John;20;2000-01-01\n"), header=False, delimiter=";"
+        )
+        self.assertListEqual([Author("John", 20, datetime(2000, 1, 1))], list(authors))
+
+
+class TestIterBuffer(TestCase):
+    def test_derived_layout(self):
+        @structured()
+        @dataclasses.dataclass(frozen=True)
+        class Tick:
+            price: float
+            quantity: int
+            buyer: bool
+            at: datetime
+
+        self.assertDictEqual({0: "d", 1: "q", 2: "?", 3: "d"}, Tick.buffer_map())
+        with self.assertRaises(TypeError):
+            Author.buffer_map()
+
+    def test_iter_buffer(self):
+        data = _record(b"AAPL", 187.5, 10) + _record(b"MSFT", 402.25, 0)
+        errors = []
+        trades = list(Trade.iter_buffer(memoryview(data), errors=errors))
+        self.assertListEqual([Trade("AAPL", 187.5, 10, EXECUTED_AT)], trades)
+        self.assertListEqual([1], [error.index for error in errors])
+
+        with self.assertRaises(Trade.ValidationError):
+            next(Trade.iter_buffer(data[:-1]))
+
+        big_endian = struct.pack(">8sdqd", b"IBM", 1.5, 3, EXECUTED_AT.timestamp())
+        self.assertListEqual(
+            [Trade("IBM", 1.5, 3, EXECUTED_AT)],
+            list(Trade.iter_buffer(big_endian, byte_order=">")),
+        )
+
+    def test_memory_mapped_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trades.bin")
+            with open(path, "wb") as f:
+                f.write(b"".join(_record(b"AAPL", i, i + 1) for i in range(100)))
+
+            trades = Trade.iter_buffer(path)
+            self.assertEqual(Trade("AAPL", 0.0, 1, EXECUTED_AT), next(trades))
+            trades.close()
+            self.assertEqual(100, sum(1 for _ in Trade.iter_buffer(path)))
+
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as buffer:
+                self.assertEqual(100, len(list(Trade.iter_buffer(buffer))))
+
+            open(path, "wb").close()
+            self.assertListEqual([], list(Trade.iter_buffer(path)))
@@ -1,8 +1,9 @@
 import dataclasses
 from datetime import datetime
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from fastructure import structured
+from fastructure.exceptions import RowError
 
 
 class TestFromDic(TestCase):
@@ -114,3 +115,115 @@ class TestFromList(TestCase):
         self.assertEqual("John Doe", person.name)
         self.assertEqual(20, person.age)
         self.assertEqual(datetime(2000, 1, 1), person.birthday)
+
+
+class TestMapIndex(TestCase):
+    def test_maps_are_resolved_once(self):
+        keys = {"name": "name", "age": "age"}
+
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Person:
+            name: str
+            age: int
+
+            @classmethod
+            def dict_map(cls) -> dict:
+                return dict(keys)
+
+            @classmethod
+            def list_map(cls) -> dict:
+                return {2: cls.name, 0: cls.age}
+
+        with mock.patch.object(Person, "dict_map", wraps=Person.dict_map) as dict_map:
+            for _ in range(3):
+                Person.from_dict({"name": "John", "age": "20"})
+            Person.to_dict(Person("John", 20))
+        dict_map.assert_called_once()
+        self.assertEqual((("name", "name"), ("age", "age")), Person._dict_index().pairs)
+        self.assertEqual(3, Person._list_index().length)
+
+        self.assertEqual(Person("John", 20), Person.from_list(["20", None, "John"]))
+        with self.assertRaises(Person.ValidationError):
+            Person.from_list(["20", None])
+
+        keys["full_name"] = keys.pop("name")
+        self.assertEqual(
+            Person("John", 1), Person.from_dict({"name": "John", "age": 1})
+        )
+        Person.invalidate_maps()
+        self.assertEqual(
+            Person("Jane", 20), Person.from_dict({"full_name": "Jane", "age": 20})
+        )
+        self.assertDictEqual(
+            {"full_name": "Jane", "age": 20}, Person("Jane", 20).to_dict()
+        )
+        with self.assertRaises(Person.ValidationError):
+            Person.from_dict({"name": "John", "age": 1})
+
+    def test_invalidate_compiled_loaders(self):
+        keys = {"name": "name"}
+
+        @structured(compile=True)
+        @dataclasses.dataclass(frozen=True)
+        class Person:
+            name: str
+
+            @classmethod
+            def dict_map(cls) -> dict:
+                return dict(keys)
+
+        self.assertEqual(Person("John"), Person.from_dict({"name": "John"}))
+        keys["full_name"] = keys.pop("name")
+        Person.invalidate_maps()
+        self.assertEqual(Person("Jane"), Person.from_dict({"full_name": "Jane"}))
+
+
+class TestBulk(TestCase):
+    def test_from_dicts(self):
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Person:
+            name: str
+            age: int
+
+            @classmethod
+            def dict_map(cls) -> dict:
+                return {"key-name": cls.name, "key-age": cls.age}
+
+        rows = [{"key-name": "John", "key-age": "20"}, {"key-name": "Jane"}]
+        with self.assertRaises(Person.ValidationError):
+            Person.from_dicts(rows)
+
+        Person.invalidate_maps()
+        with mock.patch.object(Person, "dict_map", wraps=Person.dict_map) as dict_map:
+            errors = []
+            people = Person.from_dicts(rows * 3, errors=errors)
+        dict_map.assert_called_once()
+        self.assertListEqual([Person("John", 20)] * 3, people)
+        self.assertListEqual([1, 3, 5], [error.index for error in errors])
+        self.assertIsInstance(errors[0], RowError)
+        self.assertIsInstance(errors[0].error, Person.ValidationError)
+
+    def test_from_lists(self):
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Person:
+            name: str
+            age: int
+
+            @classmethod
+            def clean_name(cls, first_name: str, last_name: str) -> str:
+                return f"{first_name} {last_name}"
+
+            @classmethod
+            def list_map(cls) -> list:
+                return ["first_name", "last_name", cls.age]
+
+        errors = []
+        people = Person.from_lists(
+            [["John", "Doe", "20"], ["Jane", "Doe"], ["Jane", "Doe", 30]],
+            errors=errors,
+        )
+        self.assertListEqual([Person("John Doe", 20), Person("Jane Doe", 30)], people)
+        self.assertListEqual([1], [error.index for error in errors])
@@ -0,0 +1,68 @@
+import dataclasses
+import pickle
+from datetime import datetime
+from unittest import TestCase
+
+from fastructure import structured
+from fastructure.exceptions import ConvertError
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Author:
+    name: str
+    age: int
+    birthday: datetime
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Book:
+    title: str
+    authors: list[Author]
+
+
+class TestParallel(TestCase):
+    def test_pickle(self):
+        author = Author("John", 20, datetime(2000, 1, 1))
+        self.assertEqual(author, pickle.loads(pickle.dumps(author)))
+
+    def test_from_dicts_in_workers(self):
+        rows = [
+            {
+                "title": f"Book {i}",
+                "authors": [{"name": "John", "age": str(i), "birthday": "2000-01-01"}],
+            }
+            for i in range(50)
+        ]
+        rows[7]["authors"][0]["age"] = "seven"
+        rows[33] = {"title": "Book 33"}
+
+        errors = []
+        books = Book.from_dicts(rows, workers=2, chunksize=10, errors=errors)
+        self.assertListEqual(
+            [i for i in range(50) if i not in (7, 33)],
+            [book.authors[0].age for book in books],
+        )
+        self.assertListEqual([7, 33], [error.index for error in errors])
+
+        # the same error as without workers.
+        with self.assertRaises(ConvertError) as e:
+            Book.from_dicts(rows, workers=2, chunksize=10)
+        self.assertListEqual(["raised by row 7"], e.exception.__notes__)
+        with self.assertRaises(ConvertError):
+            Book.from_dicts(rows)
+
+        self.assertListEqual(
+            [Author("John", 20, datetime(2000, 1, 1))],
+            Author.from_lists([["John", "20", "2000-01-01"]], workers=1),
+        )
+
+    def test_local_model(self):
+        @structured()
+        @dataclasses.dataclass(frozen=True)
+        class Local:
+            name: str
+
+        with self.assertRaisesRegex(TypeError, "must be defined at module level"):
+            Local.from_dicts([{"name": "John"}], workers=2)
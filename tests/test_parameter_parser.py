@@ -2,9 +2,10 @@ import dataclasses
 from datetime import datetime, timedelta
 from functools import singledispatchmethod
 from typing import Annotated
-from unittest import TestCase
+from unittest import TestCase, mock
 
-from fastructure import structured
+from fastructure import structured, warmup
+from fastructure.parameter_parser import Binding, ParameterParser
 from fastructure.typehints import AutoConvert
 
 
@@ -158,3 +159,46 @@ class TestMethodKwargs(TestCase):
 
         author = Author._construct(name=123)
         self.assertEqual("123", author.name)
+
+
+class TestBinding(TestCase):
+    def test_binding_is_cached(self):
+        @structured()
+        @dataclasses.dataclass(frozen=True, kw_only=True)
+        class Author:
+            name: str
+
+            @classmethod
+            def clean_name(cls, name: Annotated[str, AutoConvert]) -> str:
+                return name.strip()
+
+        warmup([Author])
+        config = Author._config
+        binding = Binding.of(Author.clean_name, config)
+        self.assertIs(binding, Binding.of(Author.clean_name, config))
+        self.assertEqual(("name",), binding.param_names)
+
+        with mock.patch("inspect.signature") as signature:
+            author = Author._construct(name=123)
+            ParameterParser(Author.clean_name, config, {"name": 1}).dict_params
+        signature.assert_not_called()
+        self.assertEqual("123", author.name)
+
+    def test_redefined_class_gets_new_binding(self):
+        def define():
+            @structured()
+            @dataclasses.dataclass(frozen=True, kw_only=True)
+            class Author:
+                name: str
+
+                @classmethod
+                def clean_name(cls, name: str) -> str:
+                    return name.strip()
+
+            return Author
+
+        first, second = define(), define()
+        self.assertIsNot(
+            Binding.of(first.clean_name, first._config),
+            Binding.of(second.clean_name, second._config),
+        )
@@ -0,0 +1,197 @@
+import dataclasses
+import subprocess
+import sys
+from datetime import datetime
+from unittest import TestCase, mock
+
+from fastructure import Converter, structured, warmup
+from fastructure.plan import ConstructionPlan
+
+
+class TestConstructionPlan(TestCase):
+    def test_plan_is_compiled_on_first_use(self):
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            name: str
+            age: int
+            birthday: datetime
+
+            @classmethod
+            def clean_name(cls, first_name: str, second_name: str) -> str:
+                return f"{first_name} {second_name}"
+
+        self.assertNotIsInstance(Author.__dict__["_plan"], ConstructionPlan)
+        plan = Author._plan
+        self.assertIsInstance(plan, ConstructionPlan)
+        self.assertIs(plan, Author.__dict__["_plan"])
+        self.assertEqual(("name",), plan.implied_keys)
+        self.assertEqual(Author.clean_name, plan.steps["name"].clean_method)
+        self.assertIs(Author.age, plan.steps["age"].reference)
+        self.assertIsNone(plan.steps["age"].clean_method)
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            plan.implied_keys = ()
+
+        with mock.patch("inspect.getmembers") as getmembers:
+            author = Author.construct(
+                first_name="John", second_name="Doe", age="20", birthday="2000-01-01"
+            )
+        getmembers.assert_not_called()
+        self.assertEqual(Author("John Doe", 20, datetime(2000, 1, 1)), author)
+
+    def test_non_callable_clean_attribute_is_skipped(self):
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            name: str
+            age: int
+
+            clean_age = None
+
+        self.assertNotIn("age", Author._plan.steps)
+        self.assertEqual("John", Author.construct(name="John", age=20).name)
+
+    def test_clean_methods_see_original_values(self):
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Price:
+            amount: int
+            currency: str
+            label: str
+
+            @classmethod
+            def clean_currency(cls, currency: str) -> str:
+                return currency.upper()
+
+            @classmethod
+            def clean_label(cls, amount, currency) -> str:
+                return f"{amount!r} {currency}"
+
+        kwargs = {"amount": "100", "currency": "jpy", "label": ""}
+        self.assertEqual(Price(100, "JPY", "'100' jpy"), Price._plan.execute(**kwargs))
+        self.assertEqual(
+            ("currency", "label"),
+            tuple(step.field_name for step in Price._plan.clean_steps),
+        )
+
+    def test_shared_conversions_are_memoized(self):
+        class CountingConverter(Converter):
+            calls = 0
+
+        @CountingConverter.register(str, datetime)
+        def _(value: str) -> datetime:
+            CountingConverter.calls += 1
+            return datetime.fromisoformat(value)
+
+        @structured(converter=CountingConverter, convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            birthday: datetime
+            age: int
+            tags: list[str]
+
+            @classmethod
+            def clean_birthday(cls, birthday: datetime) -> datetime:
+                return birthday.replace(tzinfo=None)
+
+            @classmethod
+            def clean_age(cls, birthday: datetime, tags: list[str]) -> int:
+                tags.append("aged")
+                return 2020 - birthday.year
+
+        plan = Author._plan
+        self.assertTrue(plan.has_memo)
+        self.assertEqual(frozenset({"birthday"}), plan.steps["age"].memoized)
+        self.assertEqual(frozenset(), plan.steps["tags"].memoized)
+
+        author = Author.construct(birthday="2000-01-01", tags=["a"])
+        self.assertEqual(Author(datetime(2000, 1, 1), 20, ["a"]), author)
+        self.assertEqual(1, CountingConverter.calls)
+
+        Author.construct(birthday="2000-01-01", tags=[])
+        self.assertEqual(2, CountingConverter.calls)
+
+    def test_mutable_models_are_not_memoized(self):
+        @structured()
+        @dataclasses.dataclass
+        class Address:
+            city: str
+
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            address: Address
+            label: str
+
+            @classmethod
+            def clean_label(cls, address: Address) -> str:
+                address.city = address.city.upper()
+                return address.city
+
+        self.assertEqual(frozenset(), Author._plan.steps["label"].memoized)
+        author = Author.construct(address={"city": "tokyo"})
+        self.assertEqual(Author(Address("tokyo"), "TOKYO"), author)
+
+    def test_undecorated_subclass(self):
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Parent:
+            name: str
+            age: int
+
+        @dataclasses.dataclass(frozen=True)
+        class Child(Parent):
+            extra: int = 0
+
+        self.assertEqual(
+            Parent("John", 20), Parent.from_dict({"name": "John", "age": 20})
+        )
+        self.assertEqual(
+            Child("John", 20, 3), Child.construct(name="John", age=20, extra=3)
+        )
+        self.assertEqual(
+            Child("John", 20), Child.from_dict({"name": "John", "age": 20})
+        )
+        self.assertIs(Parent, Parent._plan.model)
+
+
+class TestWarmup(TestCase):
+    def test_warmup(self):
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            name: str
+            age: int
+
+        @structured(convert_all=True)
+        @dataclasses.dataclass(frozen=True)
+        class Book:
+            title: str
+            author: Author
+
+        warmup([Author])
+        self.assertIsInstance(Author.__dict__["_plan"], ConstructionPlan)
+        self.assertNotIsInstance(Book.__dict__["_plan"], ConstructionPlan)
+
+        warmup()
+        self.assertIsInstance(Book.__dict__["_plan"], ConstructionPlan)
+        data = {"title": "Python", "author": {"name": "John", "age": "20"}}
+        self.assertEqual(Book("Python", Author("John", 20)), Book.from_dict(data))
+
+    def test_import_is_light(self):
+        code = "import sys, fastructure; print(sorted(sys.modules))"
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        for module in (
+            "asyncio",
+            "concurrent.futures",
+            "json",
+            "csv",
+            "mmap",
+            "struct",
+            "pickle",
+            "threading",
+        ):
+            self.assertNotIn(repr(module), output)
@@ -0,0 +1,124 @@
+import dataclasses
+import pickle
+import tempfile
+from datetime import datetime
+from functools import singledispatchmethod
+from pathlib import Path
+from typing import Annotated
+from unittest import TestCase, mock
+
+from fastructure import plan_cache, structured
+from fastructure.parameter_parser import Binding
+from fastructure.plan import ConstructionPlan
+from fastructure.typehints import AutoConvert
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True)
+class Author:
+    name: str
+    age: int
+    birthday: datetime
+    country: str
+
+    @classmethod
+    def clean_name(cls, first_name: str, /, last_name: str) -> str:
+        return f"{first_name} {last_name}"
+
+    @classmethod
+    def clean_age(cls, birthday: datetime) -> int:
+        return 2000 - birthday.year
+
+    @singledispatchmethod
+    @classmethod
+    def clean_country(cls, country, **kwargs) -> str:
+        return country.upper()
+
+    @classmethod
+    def clean(cls, age: Annotated[int, AutoConvert], **kwargs) -> dict:
+        return {"age": age, **kwargs}
+
+
+ROW = {
+    "first_name": "John",
+    "last_name": "Smith",
+    "birthday": "1980-01-01",
+    "country": "us",
+}
+
+
+def _bindings(plan: ConstructionPlan) -> list[Binding]:
+    steps = [step.binding for step in plan.steps.values() if step.binding]
+    return [*steps, plan.clean_binding, plan.init_binding]
+
+
+class TestSpec(TestCase):
+    def test_round_trip(self):
+        plan = Author._plan
+        spec = plan.to_spec()
+        self.assertEqual({"birthday"}, plan.steps["age"].memoized)
+
+        loaded = ConstructionPlan.from_spec(Author, spec)
+        self.assertEqual(spec, loaded.to_spec())
+        self.assertListEqual(list(plan.steps), list(loaded.steps))
+        self.assertEqual(plan.steps["birthday"], loaded.steps["birthday"])
+        self.assertEqual(
+            Author("John Smith", 20, datetime(1980, 1, 1), "US"),
+            loaded.execute(name=None, age=None, **ROW),
+        )
+
+    def test_bindings_are_rebuilt_by_name(self):
+        for binding in _bindings(Author._plan):
+            method = getattr(Author, binding.method_name, Author)
+            built = Binding._build(method, Author._config, binding.to_spec())
+            for name in Binding.__slots__:
+                if name != "annotations":
+                    self.assertEqual(getattr(binding, name), getattr(built, name))
+            self.assertDictEqual(
+                {k: a.analysis for k, a in binding.annotations.items()},
+                {k: a.analysis for k, a in built.annotations.items()},
+            )
+
+    def test_pickle(self):
+        loaded = pickle.loads(pickle.dumps(Author._plan))
+        self.assertIs(Author, loaded.model)
+        self.assertEqual(Author._plan.to_spec(), loaded.to_spec())
+
+
+class TestPlanCache(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        patch = mock.patch.object(Author._config, "plan_cache", directory.name)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_compiled_once(self):
+        plan = plan_cache.compile(Author)
+        file = plan_cache.path(Author)
+        self.assertEqual(self.directory, file.parent)
+        prefix = f"{Author.__module__}.{Author.__qualname__}-"
+        self.assertTrue(file.name.startswith(prefix))
+        self.assertTrue(file.exists())
+
+        with mock.patch.object(ConstructionPlan, "compile") as compile_:
+            loaded = plan_cache.compile(Author)
+        compile_.assert_not_called()
+        self.assertEqual(plan.to_spec(), loaded.to_spec())
+
+    def test_stale_file_is_compiled_again(self):
+        plan_cache.path(Author).write_text('{"steps": [{"field_name": "title"}]}')
+        self.assertIsNone(plan_cache.load(Author))
+        plan = plan_cache.compile(Author)
+        self.assertEqual(plan.to_spec(), plan_cache.load(Author).to_spec())
+
+    def test_local_models_are_not_cached(self):
+        @structured(plan_cache=self.directory)
+        @dataclasses.dataclass(frozen=True)
+        class Book:
+            title: str
+
+        self.assertIsNone(plan_cache.path(Book))
+        self.assertEqual(Book("Python"), Book.from_dict({"title": "Python"}))
+        self.assertListEqual([], list(self.directory.iterdir()))
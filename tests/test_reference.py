@@ -1,9 +1,11 @@
 import dataclasses
 from datetime import datetime
+from typing import Annotated
 from unittest import TestCase
 
 from fastructure import structured
-from fastructure.reference import Reference
+from fastructure.reference import Annotation, Reference, analyse
+from fastructure.typehints import AutoConvert
 
 
 class TestReference(TestCase):
@@ -51,3 +53,28 @@ class TestReference(TestCase):
             },
             Author.mapping(),
         )
+
+
+class TestAnalysis(TestCase):
+    def test_analysis_is_interned(self):
+        @structured()
+        @dataclasses.dataclass(frozen=True)
+        class Author:
+            name: Annotated[str, AutoConvert]
+            tags: list[Annotated[str, AutoConvert]]
+            init_var: dataclasses.InitVar[Annotated[int, AutoConvert]]
+
+        analysis = analyse(Annotated[str, AutoConvert])
+        self.assertIs(analysis, Author.name.analysis)
+        self.assertIs(analysis, Annotation(Annotated[str, AutoConvert]).analysis)
+        self.assertIs(analysis, Author.tags.analysis.children[0])
+        self.assertIs(Annotated, analysis.origin)
+        self.assertTrue(analysis.is_annotated)
+        self.assertTrue(analysis.is_auto_convertible)
+
+        self.assertFalse(Author.tags.analysis.is_auto_convertible)
+        self.assertTrue(Author.tags.analysis.has_auto_convert)
+        self.assertTrue(Author.init_var.analysis.is_auto_convertible)
+        self.assertFalse(analyse(Author).is_auto_convertible)
+        self.assertTrue(analyse(list[Author]).has_fastructure_model)
+        self.assertTrue(analyse(Annotated[int, []]).is_annotated)
@@ -0,0 +1,69 @@
+import dataclasses
+import pickle
+from datetime import datetime
+from typing import Annotated
+from unittest import TestCase
+
+from fastructure import structured
+from fastructure.lazy import LazyReference, LazyValue
+from fastructure.reference import SlotReference
+from fastructure.typehints import Lazy
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(frozen=True, slots=True)
+class Author:
+    name: str
+    birthday: datetime
+
+    @classmethod
+    def clean_name(cls, name: str) -> str:
+        return name.strip()
+
+
+@structured(convert_all=True)
+@dataclasses.dataclass(slots=True)
+class Book:
+    title: str
+    authors: Annotated[list[Author], Lazy]
+    pages: int = 0
+
+
+class TestSlots(TestCase):
+    def test_slotted_model(self):
+        self.assertIsInstance(Author.name, SlotReference)
+        self.assertEqual("Author.name", Author.name.path)
+
+        author = Author.from_dict({"name": " John ", "birthday": "2000-01-01"})
+        self.assertEqual(Author("John", datetime(2000, 1, 1)), author)
+        self.assertFalse(hasattr(author, "__dict__"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            author.name = "Jane"
+        self.assertEqual(author, pickle.loads(pickle.dumps(author)))
+        self.assertDictEqual(
+            {"name": "John", "birthday": "2000-01-01T00:00:00"}, author.to_dict()
+        )
+
+    def test_lazy_slot(self):
+        self.assertIsInstance(Book.authors, LazyReference)
+        book = Book.from_list(["Book", [["John", "2000-01-01"]], "10"])
+        self.assertFalse(hasattr(book, "__dict__"))
+        self.assertIs(LazyValue, Book.__dict__["authors"]._slot.__get__(book).__class__)
+        self.assertEqual([Author("John", datetime(2000, 1, 1))], book.authors)
+        self.assertIs(book.authors, book.authors)
+        self.assertEqual(10, book.pages)
+
+        book.pages = 20
+        self.assertEqual(20, book.pages)
+        del book.pages
+        with self.assertRaises(AttributeError):
+            book.pages
+
+    def test_dict_backed_model_is_unchanged(self):
+        @structured()
+        @dataclasses.dataclass(frozen=True)
+        class Plain:
+            name: str
+
+        self.assertNotIsInstance(Plain.name, SlotReference)
+        self.assertTrue(hasattr(Plain("a"), "__dict__"))